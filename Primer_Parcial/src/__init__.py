@@ -4,11 +4,67 @@ from .markov_matrix import (
     calcular_distribucion_metodo_tiempo_retorno,
     calcular_distribucion_metodo_autovalores_gpu,
     calcular_distribucion_metodo_tiempo_retorno_gpu,
+    calcular_distribucion_sistema_directo,
     GPU_AVAILABLE,
     get_gpu_info,
     clear_gpu_memory,
     recomendar_metodo
 )
+from .backend import obtener_backend, limitar_hilos
+from .nacimiento_muerte import (
+    MatrizTridiagonal,
+    crear_matriz_probabilidad_banda,
+    calcular_distribucion_nacimiento_muerte
+)
+from .tiempos_paso import (
+    calcular_tiempos_medios_retorno,
+    calcular_matriz_primer_paso,
+    MotorTiemposLlegada,
+    huella_matriz
+)
+from .dispersa import calcular_distribucion_dispersa
+from .clases import descomponer_clases, calcular_distribucion_por_clases
+from .iterativos import (
+    metodo_sor,
+    metodo_anderson,
+    metodo_agregacion_desagregacion,
+    calcular_distribucion_iterativa
+)
+from .transitorio import (
+    distribucion_transitoria,
+    iterar_transitorio,
+    horizontes_logaritmicos
+)
+from .mezcla import curva_variacion_total, estimar_brecha_espectral
+from .simulacion import TablaAlias, SimuladorCaminantes, simular_distribucion
+from .fuera_de_memoria import (
+    MatrizEnDisco,
+    guardar_matriz_disco,
+    calcular_distribucion_fuera_de_memoria
+)
+from .precision_mixta import calcular_distribucion_precision_mixta
+from .kronecker import MatrizKronecker, calcular_distribucion_kronecker
+from .tiempo_continuo import (
+    uniformizar,
+    pesos_fox_glynn,
+    calcular_distribucion_tiempo_continuo,
+    distribucion_transitoria_continua,
+    iterar_transitorio_continuo
+)
+from .absorbentes import AnalisisAbsorcion, analizar_absorcion
+from .continuacion import barrido_continuacion
+from .incremental import SolucionadorIncremental
+from .qbd import DistribucionQBD, calcular_distribucion_qbd, ensamblar_qbd, matriz_g
+from .estados_pesados import estimar_estados_pesados
+from .reordenamiento import ancho_banda, calcular_distribucion_reordenada, permutacion_rcm
+from .calibracion import calibrar, cargar_perfil, calcular_distribucion
+from .agregacion import particion_agregable, cadena_cociente, calcular_distribucion_agregada
+from .lotes import (
+    crear_matrices_probabilidad_lote,
+    calcular_distribuciones_lote,
+    calcular_distribuciones_autovalores_lote,
+    calcular_distribuciones_parametros
+)
 
 __all__ = [
     'crear_matriz_probabilidad',
@@ -16,8 +72,66 @@ __all__ = [
     'calcular_distribucion_metodo_tiempo_retorno',
     'calcular_distribucion_metodo_autovalores_gpu',
     'calcular_distribucion_metodo_tiempo_retorno_gpu',
+    'calcular_distribucion_sistema_directo',
     'GPU_AVAILABLE',
     'get_gpu_info',
     'clear_gpu_memory',
-    'recomendar_metodo'
+    'recomendar_metodo',
+    'obtener_backend',
+    'limitar_hilos',
+    'MatrizTridiagonal',
+    'crear_matriz_probabilidad_banda',
+    'calcular_distribucion_nacimiento_muerte',
+    'calcular_tiempos_medios_retorno',
+    'calcular_matriz_primer_paso',
+    'MotorTiemposLlegada',
+    'huella_matriz',
+    'calcular_distribucion_dispersa',
+    'descomponer_clases',
+    'calcular_distribucion_por_clases',
+    'metodo_sor',
+    'metodo_anderson',
+    'metodo_agregacion_desagregacion',
+    'calcular_distribucion_iterativa',
+    'distribucion_transitoria',
+    'iterar_transitorio',
+    'horizontes_logaritmicos',
+    'estimar_brecha_espectral',
+    'curva_variacion_total',
+    'TablaAlias',
+    'SimuladorCaminantes',
+    'simular_distribucion',
+    'MatrizEnDisco',
+    'guardar_matriz_disco',
+    'calcular_distribucion_fuera_de_memoria',
+    'calcular_distribucion_precision_mixta',
+    'MatrizKronecker',
+    'calcular_distribucion_kronecker',
+    'uniformizar',
+    'pesos_fox_glynn',
+    'calcular_distribucion_tiempo_continuo',
+    'distribucion_transitoria_continua',
+    'iterar_transitorio_continuo',
+    'AnalisisAbsorcion',
+    'analizar_absorcion',
+    'barrido_continuacion',
+    'SolucionadorIncremental',
+    'DistribucionQBD',
+    'calcular_distribucion_qbd',
+    'ensamblar_qbd',
+    'matriz_g',
+    'estimar_estados_pesados',
+    'ancho_banda',
+    'calcular_distribucion_reordenada',
+    'permutacion_rcm',
+    'calibrar',
+    'cargar_perfil',
+    'calcular_distribucion',
+    'particion_agregable',
+    'cadena_cociente',
+    'calcular_distribucion_agregada',
+    'crear_matrices_probabilidad_lote',
+    'calcular_distribuciones_lote',
+    'calcular_distribuciones_autovalores_lote',
+    'calcular_distribuciones_parametros'
 ]
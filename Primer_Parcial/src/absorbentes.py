@@ -0,0 +1,95 @@
+"""
+Cadenas absorbentes sin formar la matriz fundamental N = (I - Q)⁻¹.
+Se factoriza (I - Q) una vez con LU dispersa y todas las cantidades salen de
+sistemas con varios lados derechos: B = NR, t = N1 y Var = (2N - I)t - t².
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .dispersa import _a_dispersa
+
+class AnalisisAbsorcion:
+    """
+    Factorización de I - Q para una cadena con estados absorbentes.
+    absorbentes: estados objetivo (se tratan como absorbentes aunque no lo sean);
+    por defecto los i con Pᵢᵢ = 1. Acepta matrices densas, dispersas o tridiagonales.
+    """
+
+    def __init__(self, matriz, absorbentes=None):
+        P = _a_dispersa(matriz)
+        n = P.shape[0]
+        if absorbentes is None:
+            absorbentes = np.flatnonzero(np.isclose(P.diagonal(), 1.0))
+        self.absorbentes = np.unique(np.atleast_1d(absorbentes)).astype(np.int64)
+        if self.absorbentes.size == 0:
+            raise ValueError("La cadena no tiene estados absorbentes")
+        self.transitorios = np.setdiff1d(np.arange(n), self.absorbentes)
+        self.n = n
+
+        T = self.transitorios
+        self._R = P[T][:, self.absorbentes].tocsc()
+        A = (sp.identity(T.size, format="csc") - P[T][:, T]).tocsc()
+        try:
+            self._lu = spla.splu(A)
+        except RuntimeError:
+            raise ValueError("I - Q es singular: hay estados que nunca se absorben")
+        self._pasos = None
+
+    def _completar(self, valores, en_absorbentes):
+        """Extiende un arreglo sobre los transitorios a los n estados."""
+        forma = (self.n,) + valores.shape[1:]
+        completo = np.empty(forma, dtype=np.float64)
+        completo[self.transitorios] = valores
+        completo[self.absorbentes] = en_absorbentes
+        return completo
+
+    def probabilidades(self):
+        """Matriz n × |absorbentes| con P_i(absorberse en el k-ésimo absorbente)."""
+        if self.transitorios.size == 0:
+            return np.eye(self.absorbentes.size)
+        B = self._lu.solve(self._R.toarray())
+        return self._completar(B, np.eye(self.absorbentes.size))
+
+    def _pasos_transitorios(self):
+        if self._pasos is None:
+            self._pasos = self._lu.solve(np.ones(self.transitorios.size))
+        return self._pasos
+
+    def pasos_esperados(self):
+        """E_i[τ], número esperado de pasos hasta la absorción (cero en los absorbentes)."""
+        if self.transitorios.size == 0:
+            return np.zeros(self.n)
+        return self._completar(self._pasos_transitorios(), 0.0)
+
+    def varianza_pasos(self):
+        """Var_i[τ] = ((2N - I)t - t∘t)ᵢ, con una resolución adicional N·t."""
+        if self.transitorios.size == 0:
+            return np.zeros(self.n)
+        t = self._pasos_transitorios()
+        varianza = 2.0 * self._lu.solve(t) - t - t * t
+        return self._completar(np.maximum(varianza, 0.0), 0.0)
+
+    def visitas_esperadas(self, desde):
+        """Fila N[desde, :]: visitas esperadas a cada transitorio partiendo de `desde`."""
+        k = np.searchsorted(self.transitorios, desde)
+        if k >= self.transitorios.size or self.transitorios[k] != desde:
+            raise ValueError("El estado inicial debe ser transitorio")
+        e = np.zeros(self.transitorios.size)
+        e[k] = 1.0
+        return self._completar(self._lu.solve(e, trans="T"), 0.0)
+
+def analizar_absorcion(matriz, absorbentes=None):
+    """
+    Dict con "absorbentes", "transitorios", "probabilidades" (n × |absorbentes|),
+    "pasos" (E_i[τ]) y "varianza" (Var_i[τ]) con una sola factorización de I - Q.
+    """
+    analisis = AnalisisAbsorcion(matriz, absorbentes)
+    return {
+        "absorbentes": analisis.absorbentes,
+        "transitorios": analisis.transitorios,
+        "probabilidades": analisis.probabilidades(),
+        "pasos": analisis.pasos_esperados(),
+        "varianza": analisis.varianza_pasos(),
+    }
@@ -0,0 +1,100 @@
+"""
+Agregabilidad (lumpability) y solución sobre la cadena cociente.
+Refinamiento de particiones hasta la partición agregable más gruesa, cadena
+cociente resuelta con los métodos existentes y desagregación del resultado.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from .calibracion import calcular_distribucion
+from .dispersa import _a_dispersa
+from .iterativos import metodo_agregacion_desagregacion
+
+DECIMALES = 10
+
+def _indicadora(etiquetas, k):
+    n = etiquetas.shape[0]
+    return sp.csr_matrix((np.ones(n), (np.arange(n), etiquetas)), shape=(n, k))
+
+def _firmas(S, pesos):
+    """Hash por fila de S (sumas por bloque redondeadas), con aritmética uint64 que desborda."""
+    S = S.tocoo()
+    valores = np.round(S.data * 10**DECIMALES).astype(np.int64).view(np.uint64)
+    firmas = np.zeros(S.shape[0], dtype=np.uint64)
+    np.add.at(firmas, S.row, valores * pesos[S.col])
+    return firmas
+
+def particion_agregable(matriz, particion_inicial=None, tipo="ordinaria"):
+    """
+    Partición agregable más gruesa que refina particion_inicial. tipo="ordinaria":
+    Σ_{k∈B} P_ik igual para todo i de un mismo bloque; como las filas suman 1, un
+    solo bloque siempre es agregable, así que hace falta particion_inicial (por
+    ejemplo, los estados agrupados por la observable que interesa). tipo="exacta":
+    Σ_{i∈B} P_ij igual para todo j de un mismo bloque; por defecto parte de un solo
+    bloque. Cada ronda agrupa los estados por (bloque, firma de sus sumas por
+    bloque), O(nnz). Retorna etiquetas 0..k-1 por estado.
+    """
+    if tipo not in ("ordinaria", "exacta"):
+        raise ValueError(f"Tipo desconocido: {tipo}")
+    if tipo == "ordinaria" and particion_inicial is None:
+        raise ValueError("La agregabilidad ordinaria necesita particion_inicial: "
+                         "desde un solo bloque no hay nada que refinar")
+    P = _a_dispersa(matriz)
+    n = P.shape[0]
+    if tipo == "exacta":
+        P = P.T.tocsr()
+    etiquetas = np.zeros(n, dtype=np.int64) if particion_inicial is None else \
+        np.unique(np.asarray(particion_inicial), return_inverse=True)[1].astype(np.int64)
+    rng = np.random.default_rng(0)
+
+    k = etiquetas.max() + 1
+    while True:
+        pesos = rng.integers(1, 2**62, size=k, dtype=np.int64).view(np.uint64)
+        firmas = _firmas(P @ _indicadora(etiquetas, k), pesos)
+        claves = np.stack((etiquetas.astype(np.uint64), firmas), axis=1)
+        nuevas = np.unique(claves, axis=0, return_inverse=True)[1].ravel().astype(np.int64)
+        if nuevas.max() + 1 == k:
+            return nuevas
+        etiquetas, k = nuevas, nuevas.max() + 1
+
+def cadena_cociente(matriz, etiquetas):
+    """
+    Matriz cociente k×k, P̂_BC = (1/|B|) Σ_{i∈B} Σ_{j∈C} P_ij. Para una partición
+    ordinaria todas las filas de B dan la misma suma; para una exacta es el cociente
+    con pesos uniformes dentro de cada bloque.
+    """
+    P = _a_dispersa(matriz)
+    k = etiquetas.max() + 1
+    M = _indicadora(etiquetas, k)
+    tamanos = np.bincount(etiquetas, minlength=k).astype(np.float64)
+    return (sp.diags(1.0 / tamanos) @ M.T @ P @ M).tocsr()
+
+def calcular_distribucion_agregada(matriz, particion_inicial=None, tipo="ordinaria", tol=1e-12):
+    """
+    Distribución estacionaria a partir de la cadena cociente de la partición
+    agregable más gruesa que refina particion_inicial (obligatoria para la
+    ordinaria, ver particion_agregable). Ordinaria: π̂ da la masa exacta de cada bloque y el reparto
+    interno se obtiene con agregación–desagregación (KMS) sobre la cadena completa,
+    arrancando de π̂. Exacta: π es uniforme dentro de cada bloque, πᵢ = π̂_B/|B|, y
+    todo el trabajo es el solve del cociente.
+    Retorna (pi, info) con "bloques", "masa_bloques" (π̂), "tipo", "iteraciones" de
+    KMS y "compresion" (n/k), que es None cuando hubo que iterar sobre los n estados.
+    """
+    P = _a_dispersa(matriz)
+    n = P.shape[0]
+    etiquetas = particion_agregable(P, particion_inicial, tipo)
+    k = etiquetas.max() + 1
+    pi_cociente = calcular_distribucion(cadena_cociente(P, etiquetas))
+    tamanos = np.bincount(etiquetas, minlength=k)
+    pi = pi_cociente[etiquetas] / tamanos[etiquetas]
+
+    iteraciones = 0
+    compresion = float(n / k)
+    if tipo == "ordinaria" and k < n:
+        pi, info_kms = metodo_agregacion_desagregacion(P, particion=etiquetas, pi0=pi, tol=tol)
+        iteraciones = info_kms["iteraciones"]
+        compresion = None
+
+    return pi, {"bloques": int(k), "masa_bloques": pi_cociente, "compresion": compresion,
+                "tipo": tipo, "iteraciones": iteraciones}
@@ -0,0 +1,52 @@
+"""
+Despacho de arreglos para los solvers: NumPy por defecto, CuPy cuando hay GPU.
+Permite fijar el número de hilos BLAS en CPU (requiere threadpoolctl).
+"""
+
+from contextlib import contextmanager
+
+import numpy as np
+
+def _initialize_gpu():
+    try:
+        import cupy as cp
+        cp.cuda.Device().compute_capability
+        return cp, True
+    except:
+        return None, False
+
+cp, GPU_AVAILABLE = _initialize_gpu()
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+def obtener_backend(nombre="auto"):
+    """Módulo de arreglos a usar: "auto" (CuPy si hay GPU, si no NumPy), "numpy" o "cupy"."""
+    if nombre == "auto":
+        return cp if GPU_AVAILABLE else np
+    if nombre == "numpy":
+        return np
+    if nombre == "cupy":
+        if not GPU_AVAILABLE:
+            raise RuntimeError("GPU no disponible")
+        return cp
+    raise ValueError(f"Backend desconocido: {nombre}")
+
+def a_host(arreglo):
+    """Copia un arreglo del backend a NumPy (sin copia si ya es NumPy)."""
+    if GPU_AVAILABLE and isinstance(arreglo, cp.ndarray):
+        return cp.asnumpy(arreglo)
+    return np.asarray(arreglo)
+
+@contextmanager
+def limitar_hilos(hilos=None):
+    """Limita los hilos BLAS dentro del bloque; sin efecto si hilos es None."""
+    if hilos is None:
+        yield
+        return
+    if threadpool_limits is None:
+        raise RuntimeError("Se requiere threadpoolctl para fijar el número de hilos")
+    with threadpool_limits(limits=hilos, user_api="blas"):
+        yield
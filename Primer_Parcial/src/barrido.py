@@ -0,0 +1,208 @@
+"""
+Barridos de tiempos sobre la rejilla (p, n) con los solvers por lotes.
+Regenera las matrices CSV de resultados/ con el mismo formato (filas p, columnas n).
+AlmacenTiempos guarda cada medición como una fila (NPZ por partes + JSON de
+metadatos) para que un barrido interrumpido se reanude sin repetir celdas.
+"""
+
+import glob
+import json
+import os
+import platform
+import time
+
+import numpy as np
+import pandas as pd
+
+from .backend import GPU_AVAILABLE
+from .lotes import crear_matrices_probabilidad_lote, _RESOLVEDORES_LOTE
+
+ARCHIVOS_LEGADO = {
+    "sistema": "matriz_tiempos_sistema_lineal.csv",
+    "autovalores": "matriz_tiempos_vectores_propios.csv",
+}
+
+GRID_P = np.round(np.arange(0.1, 1.0, 0.1), 1)
+
+def barrido_tiempos_lote(grid_n, grid_p=GRID_P, metodo="sistema", repeticiones=1):
+    """
+    Matriz de tiempos (p × n) resolviendo todos los p de cada n en una sola pila.
+    Cada celda es el tiempo amortizado de la pila (mejor de las repeticiones / len(grid_p)).
+    """
+    if metodo not in _RESOLVEDORES_LOTE:
+        raise ValueError(f"Método desconocido: {metodo}")
+    resolver = _RESOLVEDORES_LOTE[metodo]
+    grid_n, grid_p = list(grid_n), list(grid_p)
+    tiempos = np.zeros((len(grid_p), len(grid_n)))
+
+    for j, n in enumerate(grid_n):
+        pila = crear_matrices_probabilidad_lote(n, grid_p)
+        mejor = np.inf
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            resolver(pila)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        tiempos[:, j] = mejor / len(grid_p)
+
+    return pd.DataFrame(tiempos,
+                        index=[f'p={p:.1f}' for p in grid_p],
+                        columns=[f'n={n}' for n in grid_n])
+
+def regenerar_csv(directorio, grid_n=range(10, 200), grid_p=GRID_P,
+                  metodos=("sistema", "autovalores"), repeticiones=1):
+    """Escribe los CSV legados de cada método en directorio y retorna sus rutas."""
+    rutas = []
+    for metodo in metodos:
+        df = barrido_tiempos_lote(grid_n, grid_p, metodo, repeticiones)
+        ruta = os.path.join(directorio, ARCHIVOS_LEGADO[metodo])
+        df.to_csv(ruta)
+        rutas.append(ruta)
+    return rutas
+
+COLUMNAS = ("metodo", "backend", "n", "p", "repeticion", "tiempo")
+
+class AlmacenTiempos:
+    """
+    Tabla columnar de mediciones (metodo, backend, n, p, repeticion, tiempo).
+    Cada registrar() escribe una parte nueva parte_XXXXXX.npz de forma atómica, así
+    que una caída solo pierde la celda en curso; metadatos.json describe el host.
+    """
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+        ruta = os.path.join(directorio, "metadatos.json")
+        if not os.path.exists(ruta):
+            with open(ruta, "w") as f:
+                json.dump({
+                    "columnas": list(COLUMNAS),
+                    "host": platform.node(),
+                    "procesador": platform.processor(),
+                    "creado": time.strftime("%Y-%m-%d %H:%M:%S"),
+                }, f, indent=2)
+        self._medidas = self._cargar()
+
+    def _partes(self):
+        return sorted(glob.glob(os.path.join(self.directorio, "parte_*.npz")))
+
+    def _cargar(self):
+        partes = []
+        for ruta in self._partes():
+            with np.load(ruta) as datos:
+                partes.append(pd.DataFrame({c: datos[c] for c in COLUMNAS}))
+        if not partes:
+            return pd.DataFrame({c: pd.Series(dtype=t) for c, t in
+                                 zip(COLUMNAS, (str, str, np.int64, np.float64, np.int64, np.float64))})
+        return pd.concat(partes, ignore_index=True)
+
+    def medidas(self):
+        """DataFrame con todas las filas guardadas."""
+        return self._medidas.copy()
+
+    def medidas_hechas(self):
+        """Conjunto de claves (metodo, backend, n, p, repeticion) ya medidas."""
+        df = self._medidas
+        return set(zip(df["metodo"], df["backend"], df["n"].astype(int),
+                       np.round(df["p"], 6), df["repeticion"].astype(int)))
+
+    def registrar(self, filas):
+        """Agrega filas (tuplas en el orden de COLUMNAS) como una parte nueva."""
+        if not filas:
+            return
+        nuevas = pd.DataFrame(filas, columns=COLUMNAS)
+        numero = len(self._partes())
+        ruta = os.path.join(self.directorio, f"parte_{numero:06d}.npz")
+        temporal = os.path.join(self.directorio, f"tmp_{numero:06d}.npz")
+        np.savez(temporal, **{c: nuevas[c].to_numpy(dtype=str if c in ("metodo", "backend") else None)
+                              for c in COLUMNAS})
+        os.replace(temporal, ruta)
+        self._medidas = pd.concat([self._medidas, nuevas], ignore_index=True)
+
+    def pivotar_legado(self, metodo, backend=None, agregado="min"):
+        """Matriz (p × n) con el formato de los CSV legados, agregando repeticiones."""
+        df = self._medidas[self._medidas["metodo"] == metodo]
+        if backend is not None:
+            df = df[df["backend"] == backend]
+        tabla = df.pivot_table(index="p", columns="n", values="tiempo", aggfunc=agregado)
+        tabla.index = [f'p={p:.1f}' for p in tabla.index]
+        tabla.columns = [f'n={n}' for n in tabla.columns]
+        return tabla
+
+def _medidor(metodo):
+    """
+    (backend, función (n, ps) -> tiempo por p) para un solver por lotes o de calibracion.
+    Los solvers por lotes se miden con una pila de una sola matriz por p, para que
+    cada fila del almacén sea el tiempo real de esa celda y no el promedio de la pila.
+    """
+    if metodo in _RESOLVEDORES_LOTE:
+        resolver = _RESOLVEDORES_LOTE[metodo]
+
+        def medir(n, ps):
+            pila = crear_matrices_probabilidad_lote(n, ps)
+            tiempos = []
+            for k in range(len(ps)):
+                inicio = time.perf_counter()
+                resolver(pila[k:k + 1])
+                tiempos.append(time.perf_counter() - inicio)
+            return np.array(tiempos)
+        return "numpy", medir
+
+    from .calibracion import SOLUCIONADORES, _convertir
+    if metodo not in SOLUCIONADORES:
+        raise ValueError(f"Método desconocido: {metodo}")
+    funcion, representacion = SOLUCIONADORES[metodo]
+
+    def medir(n, ps):
+        tiempos = []
+        for P in crear_matrices_probabilidad_lote(n, ps):
+            matriz = _convertir(P, representacion)
+            inicio = time.perf_counter()
+            funcion(matriz)
+            tiempos.append(time.perf_counter() - inicio)
+        return np.array(tiempos)
+    return ("cupy" if metodo.endswith("_gpu") and GPU_AVAILABLE else "numpy"), medir
+
+def barrido_reanudable(almacen, grid_n, grid_p=GRID_P, metodos=("sistema",), repeticiones=1,
+                       progreso=False):
+    """
+    Mide las celdas (metodo, n, p, repeticion) que falten en el almacén y guarda
+    cada grupo (metodo, n, repeticion) apenas termina. Retorna el número de filas
+    nuevas.
+    Acepta los métodos por lotes ("sistema", "autovalores") y los de calibracion.
+    """
+    if not isinstance(almacen, AlmacenTiempos):
+        almacen = AlmacenTiempos(almacen)
+    hechas = almacen.medidas_hechas()
+    nuevas = 0
+    for metodo in metodos:
+        backend, medir = _medidor(metodo)
+        for n in grid_n:
+            for r in range(repeticiones):
+                faltan = [p for p in grid_p
+                          if (metodo, backend, int(n), round(float(p), 6), r) not in hechas]
+                if not faltan:
+                    continue
+                tiempos = medir(int(n), faltan)
+                almacen.registrar([(metodo, backend, int(n), round(float(p), 6), r, float(t))
+                                   for p, t in zip(faltan, tiempos)])
+                nuevas += len(faltan)
+                if progreso:
+                    print(f"{metodo} n={n} repetición {r}: {len(faltan)} celdas")
+    return nuevas
+
+def exportar_csv_legado(almacen, directorio, metodos=("sistema", "autovalores")):
+    """Escribe los CSV legados a partir del almacén y retorna sus rutas."""
+    rutas = []
+    for metodo in metodos:
+        ruta = os.path.join(directorio, ARCHIVOS_LEGADO.get(metodo, f"matriz_tiempos_{metodo}.csv"))
+        almacen.pivotar_legado(metodo).to_csv(ruta)
+        rutas.append(ruta)
+    return rutas
+
+if __name__ == "__main__":
+    directorio = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resultados')
+    almacen = AlmacenTiempos(os.path.join(directorio, "almacen_tiempos"))
+    barrido_reanudable(almacen, range(10, 200), metodos=("sistema", "autovalores"),
+                       repeticiones=3, progreso=True)
+    for ruta in exportar_csv_legado(almacen, directorio):
+        print(f"Resultados guardados en {ruta}")
@@ -0,0 +1,225 @@
+"""
+Calibración de solvers en la máquina actual y selección automática.
+`python -m src.calibracion` mide cada solver sobre una escalera de tamaños, con
+entradas representativas de cada representación (densas aleatorias, dispersas
+aleatorias a varias densidades, tridiagonales), y guarda el perfil en caché;
+calcular_distribucion(matriz, metodo="auto") lo usa para elegir.
+"""
+
+import argparse
+import json
+import os
+import platform
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from .backend import GPU_AVAILABLE
+from .dispersa import calcular_distribucion_dispersa
+from .markov_matrix import (
+    calcular_distribucion_metodo_autovalores,
+    calcular_distribucion_metodo_tiempo_retorno,
+    calcular_distribucion_sistema_directo,
+)
+from .nacimiento_muerte import (
+    MatrizTridiagonal,
+    calcular_distribucion_nacimiento_muerte,
+    crear_matriz_probabilidad_banda,
+)
+
+TAMANOS = (10, 30, 100, 300, 1000)
+DENSIDAD_DISPERSA = 0.05
+DENSIDADES = (0.001, 0.01, DENSIDAD_DISPERSA)
+MAX_DENSA = 20000
+
+# nombre -> (función, representación de entrada: "densa" | "dispersa" | "tridiagonal")
+SOLUCIONADORES = {
+    "autovalores": (calcular_distribucion_metodo_autovalores, "densa"),
+    "tiempo_retorno": (calcular_distribucion_metodo_tiempo_retorno, "densa"),
+    "sistema_directo": (lambda P: calcular_distribucion_sistema_directo(P, "numpy"), "densa"),
+    "dispersa": (calcular_distribucion_dispersa, "dispersa"),
+    "nacimiento_muerte": (calcular_distribucion_nacimiento_muerte, "tridiagonal"),
+}
+if GPU_AVAILABLE:
+    SOLUCIONADORES["sistema_directo_gpu"] = (
+        lambda P: calcular_distribucion_sistema_directo(P, "cupy"), "densa")
+
+def ruta_perfil():
+    """Archivo de caché del perfil ($XDG_CACHE_HOME/cadenas_markov/perfil_solvers.json)."""
+    base = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "cadenas_markov", "perfil_solvers.json")
+
+def _convertir(P, representacion):
+    if representacion == "dispersa":
+        return sp.csr_matrix(P)
+    if representacion == "tridiagonal":
+        return MatrizTridiagonal.desde_densa(P)
+    return P
+
+def _densa_aleatoria(n, rng):
+    P = rng.random((n, n))
+    return P / P.sum(axis=1, keepdims=True)
+
+def _dispersa_aleatoria(n, densidad, rng):
+    """CSR estocástica con ~densidad·n entradas por fila más un ciclo (irreducible)."""
+    k = max(1, int(round(densidad * n)))
+    filas = np.repeat(np.arange(n), k + 1)
+    columnas = np.column_stack((rng.integers(0, n, size=(n, k)), (np.arange(n) + 1) % n)).ravel()
+    P = sp.csr_matrix((rng.random(filas.size), (filas, columnas)), shape=(n, n))
+    return (sp.diags(1.0 / np.asarray(P.sum(axis=1)).ravel()) @ P).tocsr()
+
+def _entrada(n, representacion, rng, densidad=None):
+    """Matriz representativa de cada representación para medir."""
+    if representacion == "dispersa":
+        return _dispersa_aleatoria(n, densidad, rng)
+    if representacion == "tridiagonal":
+        return crear_matriz_probabilidad_banda(n, 0.5)
+    return _densa_aleatoria(n, rng)
+
+def _medir(funcion, matriz, repeticiones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(matriz)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def calibrar(tamanos=TAMANOS, repeticiones=3, archivo=None, densidades=DENSIDADES, semilla=0):
+    """
+    Mide cada solver disponible en la escalera de tamaños y guarda el perfil. Los
+    solvers densos se miden con matrices densas aleatorias, los dispersos con CSR
+    aleatorias en cada densidad de `densidades` (tiempos[nombre][densidad][tamaño])
+    y nacimiento_muerte con la cadena tridiagonal.
+    """
+    rng = np.random.default_rng(semilla)
+    tiempos = {}
+    for nombre, (funcion, representacion) in SOLUCIONADORES.items():
+        if representacion == "dispersa":
+            tiempos[nombre] = [[_medir(funcion, _entrada(n, representacion, rng, d), repeticiones)
+                                for n in tamanos] for d in densidades]
+        else:
+            tiempos[nombre] = [_medir(funcion, _entrada(n, representacion, rng), repeticiones)
+                               for n in tamanos]
+
+    perfil = {
+        "host": platform.node(),
+        "procesador": platform.processor(),
+        "gpu": GPU_AVAILABLE,
+        "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "tamanos": list(tamanos),
+        "densidades": list(densidades),
+        "tiempos": tiempos,
+    }
+    archivo = archivo or ruta_perfil()
+    os.makedirs(os.path.dirname(archivo), exist_ok=True)
+    with open(archivo, "w") as f:
+        json.dump(perfil, f, indent=2)
+    return perfil
+
+def cargar_perfil(archivo=None):
+    """Perfil guardado por calibrar(), o None si no existe."""
+    archivo = archivo or ruta_perfil()
+    if not os.path.exists(archivo):
+        return None
+    with open(archivo) as f:
+        return json.load(f)
+
+def _interpolar_log(x, y, t):
+    """Interpolación lineal en escala log; extrapola con el último tramo."""
+    x, y, t = np.log(x), np.log(np.maximum(y, 1e-9)), np.log(t)
+    if t > x[-1] and x.size > 1:
+        return float(np.exp(y[-1] + (y[-1] - y[-2]) / (x[-1] - x[-2]) * (t - x[-1])))
+    return float(np.exp(np.interp(t, x, y)))
+
+def _tiempo_estimado(perfil, nombre, n, densidad=None):
+    """
+    Tiempo interpolado en log-log sobre los tamaños; para los solvers dispersos se
+    interpola además en la densidad (acotada al rango calibrado).
+    """
+    if nombre not in perfil["tiempos"]:
+        return np.inf
+    tamanos = np.asarray(perfil["tamanos"], dtype=np.float64)
+    medidos = np.asarray(perfil["tiempos"][nombre], dtype=np.float64)
+    if medidos.ndim == 1:
+        return _interpolar_log(tamanos, medidos, n)
+
+    densidades = np.asarray(perfil["densidades"], dtype=np.float64)
+    por_densidad = [_interpolar_log(tamanos, fila, n) for fila in medidos]
+    densidad = np.clip(densidad if densidad is not None else densidades[0],
+                       densidades[0], densidades[-1])
+    return _interpolar_log(densidades, por_densidad, densidad)
+
+def _estructura(matriz):
+    """Representación más barata de la matriz: tridiagonal, dispersa o densa."""
+    if isinstance(matriz, MatrizTridiagonal):
+        return "tridiagonal", matriz
+    if sp.issparse(matriz):
+        return "dispersa", matriz.tocsr()
+
+    matriz = np.asarray(matriz, dtype=np.float64)
+    if not np.any(np.triu(matriz, 2)) and not np.any(np.tril(matriz, -2)):
+        return "tridiagonal", MatrizTridiagonal.desde_densa(matriz)
+    if np.count_nonzero(matriz) < DENSIDAD_DISPERSA * matriz.size:
+        return "dispersa", sp.csr_matrix(matriz)
+    return "densa", matriz
+
+def _densidad(matriz):
+    if isinstance(matriz, MatrizTridiagonal):
+        return 3.0 / matriz.n
+    nnz = matriz.nnz if sp.issparse(matriz) else np.count_nonzero(matriz)
+    return nnz / float(matriz.shape[0] * matriz.shape[1])
+
+def elegir_solucionador(matriz, perfil=None):
+    """Nombre del solver más rápido según estructura, tamaño y el perfil del host."""
+    estructura, _ = _estructura(matriz)
+    if estructura == "tridiagonal":
+        return "nacimiento_muerte"
+
+    perfil = perfil or cargar_perfil()
+    n = matriz.shape[0]
+    candidatos = ["dispersa"] if estructura == "dispersa" else []
+    if estructura == "densa" or n <= MAX_DENSA:
+        candidatos += [nombre for nombre, (_, rep) in SOLUCIONADORES.items() if rep == "densa"]
+    if perfil is None:
+        return candidatos[0] if estructura == "dispersa" else "sistema_directo"
+    densidad = _densidad(matriz)
+    return min(candidatos, key=lambda nombre: _tiempo_estimado(perfil, nombre, n, densidad))
+
+def calcular_distribucion(matriz, metodo="auto", perfil=None):
+    """
+    Distribución estacionaria con el solver indicado o, con metodo="auto", con el
+    más rápido para el tamaño, la dispersión y la estructura de la matriz.
+    """
+    if metodo == "auto":
+        metodo = elegir_solucionador(matriz, perfil)
+    if metodo not in SOLUCIONADORES:
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    funcion, representacion = SOLUCIONADORES[metodo]
+    estructura, matriz = _estructura(matriz)
+    if representacion != "dispersa" and estructura != representacion:
+        densa = matriz if estructura == "densa" else (
+            matriz.toarray() if sp.issparse(matriz) else matriz.a_densa())
+        matriz = _convertir(densa, representacion)
+    return funcion(matriz)
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibra los solvers en esta máquina.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--archivo", default=None)
+    args = parser.parse_args()
+
+    perfil = calibrar(args.tamanos, args.repeticiones, args.archivo)
+    for nombre, tiempos in perfil["tiempos"].items():
+        if np.ndim(tiempos) == 1:
+            print(f"{nombre:>20}: " + "  ".join(f"{t:.2e}" for t in tiempos))
+            continue
+        for densidad, fila in zip(perfil["densidades"], tiempos):
+            etiqueta = f"{nombre} ({densidad:g})"
+            print(f"{etiqueta:>20}: " + "  ".join(f"{t:.2e}" for t in fila))
+    print(f"Perfil guardado en {args.archivo or ruta_perfil()}")
+
+if __name__ == "__main__":
+    main()
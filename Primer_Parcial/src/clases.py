@@ -0,0 +1,92 @@
+"""
+Descomposición en clases comunicantes antes de resolver.
+Componentes fuertemente conexas del grafo de transiciones en tiempo lineal, clases
+cerradas, estados transitorios y periodo de cada clase; luego una distribución
+estacionaria por clase cerrada sobre bloques mucho más pequeños.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.csgraph as csgraph
+import scipy.sparse.linalg as spla
+
+from .dispersa import _a_dispersa, calcular_distribucion_dispersa
+from .tiempos_paso import _distribucion_fundamental
+
+MAX_DENSA = 2000
+
+def _periodo(G, estados):
+    """gcd de d(u) + 1 - d(v) sobre las aristas u→v de la clase (d: distancia BFS)."""
+    if estados.size == 1:
+        return 1
+    sub = G[estados][:, estados]
+    d = csgraph.dijkstra(sub, indices=0, unweighted=True)
+    u, v = sub.nonzero()
+    return int(np.gcd.reduce((d[u] + 1 - d[v]).astype(np.int64)))
+
+def descomponer_clases(matriz, periodos=False):
+    """
+    Dict con "componentes" (etiqueta de componente fuertemente conexa por estado),
+    "cerradas" (lista de arreglos de estados de cada clase cerrada) y "transitorios"
+    (estados fuera de toda clase cerrada). Con periodos=True agrega "periodos", uno
+    por clase cerrada (un BFS por clase; ningún solver lo necesita).
+    """
+    G = _a_dispersa(matriz)
+    G.eliminate_zeros()
+    k, etiquetas = csgraph.connected_components(G, directed=True, connection="strong")
+
+    u, v = G.nonzero()
+    salida = etiquetas[u] != etiquetas[v]
+    abiertas = np.zeros(k, dtype=bool)
+    abiertas[etiquetas[u[salida]]] = True
+
+    orden = np.argsort(etiquetas, kind="stable")
+    grupos = np.split(orden, np.cumsum(np.bincount(etiquetas, minlength=k))[:-1])
+    cerradas = [grupos[c] for c in range(k) if not abiertas[c]]
+    clases = {
+        "componentes": etiquetas,
+        "cerradas": cerradas,
+        "transitorios": np.flatnonzero(abiertas[etiquetas]),
+    }
+    if periodos:
+        clases["periodos"] = [_periodo(G, estados) for estados in cerradas]
+    return clases
+
+def _distribucion_bloque(bloque):
+    if bloque.shape[0] == 1:
+        return np.ones(1, dtype=np.float64)
+    if bloque.shape[0] <= MAX_DENSA:
+        pi = np.abs(_distribucion_fundamental(bloque.toarray()))
+        return pi / np.sum(pi)
+    return calcular_distribucion_dispersa(bloque)
+
+def _pesos_absorcion(P, cerradas, transitorios):
+    """Probabilidad de terminar en cada clase cerrada partiendo de un estado uniforme."""
+    n = P.shape[0]
+    pesos = np.array([estados.size for estados in cerradas], dtype=np.float64)
+    if transitorios.size:
+        Q = P[transitorios][:, transitorios]
+        R = P[transitorios]
+        R = np.column_stack([np.asarray(R[:, estados].sum(axis=1)).ravel()
+                             for estados in cerradas])
+        A = (sp.identity(transitorios.size, format="csc") - Q).tocsc()
+        pesos += spla.splu(A).solve(R).sum(axis=0)
+    return pesos / n
+
+def calcular_distribucion_por_clases(matriz, clases=None):
+    """
+    Distribución estacionaria de cada clase cerrada, resuelta en su propio bloque.
+    Retorna el dict de descomponer_clases() más "distribuciones" (π de cada clase,
+    indexada como "cerradas"), "pesos" (probabilidad de absorción en cada clase desde
+    un estado inicial uniforme) y "pi", la mezcla Σ pesos·π_clase en n estados.
+    """
+    P = _a_dispersa(matriz)
+    clases = clases or descomponer_clases(P)
+    cerradas = clases["cerradas"]
+
+    distribuciones = [_distribucion_bloque(P[estados][:, estados]) for estados in cerradas]
+    pesos = _pesos_absorcion(P, cerradas, clases["transitorios"])
+    pi = np.zeros(P.shape[0], dtype=np.float64)
+    for estados, pi_clase, peso in zip(cerradas, distribuciones, pesos):
+        pi[estados] = peso * pi_clase
+    return dict(clases, distribuciones=distribuciones, pesos=pesos, pi=pi)
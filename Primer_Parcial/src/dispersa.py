@@ -0,0 +1,144 @@
+"""
+Distribución estacionaria para cadenas grandes con matrices scipy.sparse.
+Solo extrae el vector propio izquierdo dominante, sin materializar la matriz densa.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .nacimiento_muerte import MatrizTridiagonal
+
+PIVOTE_MIN = 1e-13
+MAX_REINICIOS_ARNOLDI = 20
+
+def _a_dispersa(matriz):
+    if isinstance(matriz, MatrizTridiagonal):
+        return matriz.a_dispersa()
+    return sp.csr_matrix(matriz, dtype=np.float64)
+
+def _normalizar(v):
+    pi = np.abs(np.real(v)).ravel()
+    return pi / np.sum(pi)
+
+def _estado_pivote(PT, pasos=20):
+    """Estado con más masa tras unas iteraciones de potencia; evita fijar un πₖ diminuto."""
+    v = np.full(PT.shape[0], 1.0 / PT.shape[0])
+    for _ in range(pasos):
+        v = PT @ v
+    return int(np.argmax(v))
+
+def _sistema_normalizado(PT):
+    """
+    A' = I - Pᵀ con la fila k reemplazada por eₖᵀ (dispersa y no singular si la
+    cadena es irreducible). El sistema con normalización es A' + eₖ(1 - eₖ)ᵀ.
+    """
+    n = PT.shape[0]
+    k = _estado_pivote(PT)
+    mascara = np.ones(n)
+    mascara[k] = 0.0
+    A = sp.diags(mascara) @ (sp.identity(n, format="csr") - PT)
+    A = (A + sp.csr_matrix(([1.0], ([k], [k])), shape=(n, n))).tocsc()
+    return A, k
+
+def _factorizar(A, factorizacion, **opciones):
+    """
+    LU (splu) o ILU (spilu) de A', o None si un pivote es despreciable frente al
+    mayor: A' es singular porque la cadena tiene varias clases cerradas.
+    """
+    try:
+        lu = factorizacion(A, **opciones)
+    except RuntimeError:
+        return None
+    pivotes = np.abs(lu.U.diagonal())
+    if pivotes.min() <= PIVOTE_MIN * A.shape[0] * pivotes.max():
+        return None
+    return lu
+
+def _metodo_directo(PT, comprobar=True):
+    """
+    LU dispersa de A' y corrección de rango uno: π ∝ A'⁻¹eₖ. None si A' parece
+    singular (con comprobar=False se resuelve igual).
+    """
+    A, k = _sistema_normalizado(PT)
+    lu = _factorizar(A, spla.splu) if comprobar else spla.splu(A)
+    if lu is None:
+        return None
+    e = np.zeros(PT.shape[0])
+    e[k] = 1.0
+    return _normalizar(lu.solve(e))
+
+def _metodo_gmres(PT, tol, max_iter, drop_tol):
+    """
+    GMRES sobre el sistema con normalización, precondicionado con ILU de A'.
+    None si el ILU muestra que A' es singular.
+    """
+    n = PT.shape[0]
+    A, k = _sistema_normalizado(PT)
+    ilu = _factorizar(A, spla.spilu, drop_tol=drop_tol)
+    if ilu is None:
+        return None
+    e = np.zeros(n)
+    e[k] = 1.0
+    B = spla.LinearOperator((n, n), matvec=lambda x: A @ x + e * (np.sum(x) - x[k]),
+                            dtype=np.float64)
+    M = spla.LinearOperator((n, n), matvec=ilu.solve, dtype=np.float64)
+
+    pi, info = spla.gmres(B, e, M=M, rtol=tol, restart=50, maxiter=max_iter)
+    if info != 0:
+        raise RuntimeError("GMRES no convergió")
+    return _normalizar(pi)
+
+def _metodo_arnoldi(PT, tol, desplazamiento):
+    """
+    Arnoldi con shift-invert cerca de 1: el autovalor 1 domina por mucho.
+    eigs exige k < n - 1, así que las cadenas de dos estados van al solve directo.
+    Con π de rango muy amplio ARPACK puede no converger; tras MAX_REINICIOS_ARNOLDI
+    reinicios se usa el solve directo.
+    """
+    n = PT.shape[0]
+    if n <= 2:
+        return _metodo_directo(PT)
+    try:
+        _, vectores = spla.eigs(PT, k=1, sigma=1.0 + desplazamiento, v0=np.full(n, 1.0 / n),
+                                tol=tol, maxiter=MAX_REINICIOS_ARNOLDI)
+    except spla.ArpackNoConvergence:
+        return _metodo_directo(PT)
+    return _normalizar(vectores[:, 0])
+
+def calcular_distribucion_dispersa(matriz, metodo="directo", tol=1e-10, max_iter=1000,
+                                   drop_tol=1e-6, desplazamiento=1e-8):
+    """
+    Distribución estacionaria de una matriz dispersa (o MatrizTridiagonal).
+    metodo="directo": LU dispersa de (I - Pᵀ) con la normalización como rango uno.
+    metodo="gmres": GMRES precondicionado con ILU; si no converge se usa "directo".
+    metodo="arnoldi": shift-invert Arnoldi extrayendo un solo vector propio (si no
+    converge se usa "directo").
+    Si la factorización es singular y el grafo tiene varias clases cerradas (o
+    estados transitorios) se resuelve por clases.
+    """
+    PT = _a_dispersa(matriz).T.tocsr()
+    if PT.shape[0] == 1:
+        return np.ones(1, dtype=np.float64)
+
+    if metodo == "directo":
+        pi = _metodo_directo(PT)
+    elif metodo == "arnoldi":
+        pi = _metodo_arnoldi(PT, tol, desplazamiento)
+    elif metodo == "gmres":
+        try:
+            pi = _metodo_gmres(PT, tol, max_iter, drop_tol)
+        except RuntimeError:
+            pi = _metodo_directo(PT)
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    if pi is None:
+        # Un pivote diminuto también aparece en cadenas irreducibles mal condicionadas:
+        # solo se resuelve por clases si el grafo lo confirma.
+        from .clases import descomponer_clases, calcular_distribucion_por_clases
+        clases = descomponer_clases(PT.T)
+        if len(clases["cerradas"]) > 1 or clases["transitorios"].size:
+            return calcular_distribucion_por_clases(PT.T, clases)["pi"]
+        pi = _metodo_directo(PT, comprobar=False)
+    return pi
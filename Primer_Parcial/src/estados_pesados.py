@@ -0,0 +1,212 @@
+"""
+Estados de mayor masa estacionaria sin calcular π completo.
+Caminantes vectorizados muestrean las filas CSR por búsqueda binaria sobre sumas
+acumuladas locales de las filas que visitan (sin tablas de alias ni pasadas sobre
+P.data): una fase de visitas propone candidatos, las excursiones del candidato más
+visitado agregan a sus vecinos pesados y una fase de retornos truncados estima
+πᵢ = 1/Eᵢ[Tᵢ] para cada candidato con su error. El trabajo depende de los
+caminantes, los pasos y el grado de las filas visitadas, no del número de estados.
+"""
+
+import numpy as np
+
+from .dispersa import _a_dispersa
+
+Z_95 = 1.96
+GRADO_CACHE = 256
+
+def _acumulado_fila(P, fila, acumulados):
+    """Suma acumulada de la fila (de grado > GRADO_CACHE), calculada en su primera visita."""
+    acumulado = acumulados.get(fila)
+    if acumulado is None:
+        acumulado = np.cumsum(P.data[P.indptr[fila]:P.indptr[fila + 1]])
+        acumulados[fila] = acumulado
+    return acumulado
+
+def _paso_csr(P, estados, rng, acumulados):
+    """
+    Un paso desde cada estado por búsqueda binaria de u·(suma de la fila) en la suma
+    acumulada de su fila. Las filas distintas de grado ≤ GRADO_CACHE se acumulan en
+    el paso (una sola cumsum sobre sus tramos de P.data); las de grado mayor usan la
+    caché `acumulados` (fila -> suma acumulada), así un hub cuesta O(log grado).
+    """
+    filas, inverso = np.unique(estados, return_inverse=True)
+    inicio = P.indptr[filas]
+    grado = P.indptr[filas + 1] - inicio
+    if np.any(grado == 0):
+        raise ValueError("Todas las filas visitadas deben tener alguna transición")
+    u = rng.random(estados.shape[0])
+    posicion = np.empty(estados.shape[0], dtype=np.int64)
+
+    pequenas = grado <= GRADO_CACHE
+    cortos = pequenas[inverso]
+    if np.any(cortos):
+        g = grado[pequenas]
+        fin = np.cumsum(g)
+        desde = fin - g
+        tramos = np.repeat(inicio[pequenas] - desde, g) + np.arange(fin[-1])
+        acumulado = np.concatenate(([0.0], np.cumsum(P.data[tramos])))
+        r = (np.cumsum(pequenas) - 1)[inverso[cortos]]
+        base = acumulado[desde[r]]
+        objetivo = base + u[cortos] * (acumulado[fin[r]] - base)
+        j = np.searchsorted(acumulado, objetivo, side="right") - 1
+        posicion[cortos] = tramos[np.clip(j, desde[r], fin[r] - 1)]
+
+    largos = np.flatnonzero(~cortos)
+    if largos.size:
+        largos = largos[np.argsort(inverso[largos], kind="stable")]
+        grupos, cortes = np.unique(inverso[largos], return_index=True)
+        for r, quienes in zip(grupos, np.split(largos, cortes[1:])):
+            acumulado = _acumulado_fila(P, filas[r], acumulados)
+            j = np.searchsorted(acumulado, u[quienes] * acumulado[-1], side="right")
+            posicion[quienes] = inicio[r] + np.minimum(j, grado[r] - 1)
+    return P.indices[posicion]
+
+def _visitas(P, acumulados, caminantes, pasos, calentamiento, rng):
+    """
+    Visitas de caminantes que arrancan en estados uniformes. Retorna los estados
+    visitados (únicos), su frecuencia y el índice de cada visita en visitados
+    (pasos × caminantes).
+    """
+    n = P.shape[0]
+    estados = rng.integers(0, n, size=caminantes)
+    for _ in range(calentamiento):
+        estados = _paso_csr(P, estados, rng, acumulados)
+    trayectorias = np.empty((pasos, caminantes), dtype=np.int64)
+    for t in range(pasos):
+        estados = _paso_csr(P, estados, rng, acumulados)
+        trayectorias[t] = estados
+
+    visitados, indice = np.unique(trayectorias, return_inverse=True)
+    indice = indice.reshape(trayectorias.shape)
+    frecuencia = np.bincount(indice.ravel(), minlength=visitados.size) / trayectorias.size
+    return visitados, frecuencia, indice
+
+def _error_visitas(indice, seleccion):
+    """
+    Error estándar de la frecuencia de los estados `seleccion` (índices en visitados)
+    a partir de la dispersión entre caminantes, que absorbe la correlación temporal.
+    """
+    pasos, caminantes = indice.shape
+    mapa = np.full(indice.max() + 1, -1, dtype=np.int64)
+    mapa[seleccion] = np.arange(seleccion.size)
+    fila = mapa[indice]
+    dentro = fila >= 0
+    caminante = np.broadcast_to(np.arange(caminantes), indice.shape)
+    cuentas = np.bincount(fila[dentro] * caminantes + caminante[dentro],
+                          minlength=seleccion.size * caminantes)
+    fracciones = cuentas.reshape(seleccion.size, caminantes) / pasos
+    return fracciones.std(axis=1, ddof=1) / np.sqrt(caminantes)
+
+def _retornos_truncados(P, acumulados, candidatos, muestras, truncamiento, rng, registrar=None):
+    """
+    muestras caminantes desde cada candidato hasta volver o llegar a truncamiento
+    pasos. Retorna por candidato la media y la varianza de min(T, θ), la fracción
+    de caminantes truncados y, si registrar es un índice de candidato, los estados
+    que visitan sus excursiones (uno por visita, sin contar el regreso).
+    """
+    origen = np.repeat(np.arange(candidatos.size), muestras)
+    anclas = candidatos[origen]
+    limite = np.repeat(truncamiento, muestras)
+    tiempos = limite.astype(np.float64)
+    estados = anclas.copy()
+    activos = np.arange(anclas.size)
+    excursiones = []
+    t = 0
+    while activos.size:
+        t += 1
+        estados[activos] = _paso_csr(P, estados[activos], rng, acumulados)
+        volvio = estados[activos] == anclas[activos]
+        tiempos[activos[volvio]] = t
+        if registrar is not None:
+            excursiones.append(estados[activos[~volvio & (origen[activos] == registrar)]])
+        activos = activos[~volvio & (limite[activos] > t)]
+
+    tiempos = tiempos.reshape(candidatos.size, muestras)
+    truncados = (tiempos >= truncamiento[:, None]) & \
+        (estados.reshape(candidatos.size, muestras) != candidatos[:, None])
+    visitas = np.concatenate(excursiones) if excursiones else np.empty(0, dtype=np.int64)
+    return tiempos.mean(axis=1), tiempos.var(axis=1, ddof=1), truncados.mean(axis=1), visitas
+
+def _frecuencias_fase_visitas(visitados, frecuencia, indice, estados):
+    """pi_visitas y error_visitas de `estados`; los que no se visitaron en la fase 1 dan 0."""
+    posicion = np.minimum(np.searchsorted(visitados, estados), visitados.size - 1)
+    vistos = visitados[posicion] == estados
+    pi_visitas = np.where(vistos, frecuencia[posicion], 0.0)
+    error_visitas = np.zeros(estados.size)
+    if np.any(vistos):
+        error_visitas[vistos] = _error_visitas(indice, posicion[vistos])
+    return pi_visitas, error_visitas
+
+def estimar_estados_pesados(matriz, k=10, caminantes=10000, pasos=200, calentamiento=100,
+                            muestras=500, truncamiento=10**4, candidatos=None,
+                            visitas_minimas=100, semilla=None):
+    """
+    Aproxima los k estados de mayor πᵢ de una cadena dispersa muy grande.
+    1) `caminantes` trayectorias desde estados uniformes, `calentamiento` pasos sin
+       registrar y `pasos` registrados; los más visitados son candidatos (por defecto
+       max(2k, k+10)), descartando los de menos de `visitas_minimas` visitas (salvo
+       el primero), cuya frecuencia es ruido de caminantes de paso.
+    2) Para cada candidato, `muestras` retornos truncados en θᵢ = min(truncamiento,
+       ⌈50/π̂ᵢ⌉): πᵢ ≈ 1/E[min(Tᵢ, θᵢ)]. Las excursiones del candidato más visitado,
+       si ninguna se truncó, estiman πⱼ ≈ πᵢ·E[visitas a j] para sus vecinos; los
+       cupos libres o de candidatos truncados se llenan con los más pesados de ellos
+       y se les estiman también sus retornos.
+    Si algún retorno de un estado se truncó, 1/E[min(T, θ)] solo acota πᵢ por
+    arriba: su "pi" es NaN y su intervalo es (NaN, cota superior).
+    Retorna un dict con "estados", "pi", "error" (error estándar, método delta),
+    "intervalo" (95 %), "cota_superior", "truncados" (fracción por estado),
+    "pi_visitas" y "error_visitas" (frecuencias de la fase 1), ordenados por "pi" y
+    luego, los truncados, por su cota superior.
+    """
+    P = _a_dispersa(matriz)
+    if k < 1 or caminantes < 2 or pasos < 1 or muestras < 2:
+        raise ValueError("k, pasos deben ser ≥ 1 y caminantes, muestras ≥ 2")
+    rng = np.random.default_rng(semilla)
+    acumulados = {}
+
+    visitados, frecuencia, indice = _visitas(P, acumulados, caminantes, pasos, calentamiento, rng)
+    c = min(visitados.size, max(2 * k, k + 10) if candidatos is None else candidatos)
+    orden = np.argsort(-frecuencia, kind="stable")[:c]
+    suficientes = frecuencia[orden] * indice.size >= visitas_minimas
+    orden = orden[:max(1, np.count_nonzero(suficientes))]
+    elegidos = visitados[orden]
+
+    limite = np.minimum(truncamiento, np.ceil(50.0 / frecuencia[orden])).astype(np.int64)
+    media, varianza, truncados, excursiones = _retornos_truncados(
+        P, acumulados, elegidos, muestras, limite, rng, registrar=0)
+
+    libres = c - np.count_nonzero(truncados == 0)
+    if libres > 0 and truncados[0] == 0 and excursiones.size:
+        vecinos, cuentas = np.unique(excursiones, return_counts=True)
+        nuevos = ~np.isin(vecinos, elegidos)
+        vecinos, cuentas = vecinos[nuevos], cuentas[nuevos]
+        mas_pesados = np.argsort(-cuentas, kind="stable")[:libres]
+        vecinos = vecinos[mas_pesados]
+        pi_vecinos = cuentas[mas_pesados] / (muestras * media[0])
+        limite = np.minimum(truncamiento, np.ceil(50.0 / pi_vecinos)).astype(np.int64)
+        resultado = _retornos_truncados(P, acumulados, vecinos, muestras, limite, rng)
+        elegidos = np.concatenate((elegidos, vecinos))
+        media, varianza, truncados = (np.concatenate((a, b)) for a, b in
+                                      zip((media, varianza, truncados), resultado))
+
+    estimado = 1.0 / media
+    error = np.sqrt(varianza / muestras) / media**2
+    cota_superior = estimado + Z_95 * error
+    exacto = truncados == 0
+    pi = np.where(exacto, estimado, np.nan)
+    inferior = np.where(exacto, estimado - Z_95 * error, np.nan)
+
+    mejores = np.lexsort((-cota_superior, -np.nan_to_num(pi, nan=-1.0)))[:k]
+    pi_visitas, error_visitas = _frecuencias_fase_visitas(visitados, frecuencia, indice,
+                                                          elegidos[mejores])
+    return {
+        "estados": elegidos[mejores],
+        "pi": pi[mejores],
+        "error": error[mejores],
+        "intervalo": np.stack((inferior[mejores], cota_superior[mejores]), axis=1),
+        "cota_superior": cota_superior[mejores],
+        "truncados": truncados[mejores],
+        "pi_visitas": pi_visitas,
+        "error_visitas": error_visitas,
+    }
@@ -0,0 +1,159 @@
+"""
+Matrices de transición en disco (memory-mapped) para cadenas que no caben en RAM.
+Formatos: un directorio CSR de Pᵀ (indptr.npy, indices.npy, data.npy, meta.json)
+o un .npy denso n×n. Las iteraciones leen bloques de filas de tamaño acotado.
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .dispersa import _a_dispersa
+
+MEMORIA_BLOQUE = 64 * 2**20
+
+def guardar_matriz_disco(matriz, directorio, dtype=np.float32):
+    """Guarda Pᵀ en CSR dentro de `directorio` (las filas de Pᵀ son columnas de P)."""
+    PT = _a_dispersa(matriz).T.tocsr()
+    PT.sort_indices()
+    os.makedirs(directorio, exist_ok=True)
+    np.save(os.path.join(directorio, "indptr.npy"), PT.indptr.astype(np.int64))
+    np.save(os.path.join(directorio, "indices.npy"), PT.indices)
+    np.save(os.path.join(directorio, "data.npy"), PT.data.astype(dtype))
+    with open(os.path.join(directorio, "meta.json"), "w") as f:
+        json.dump({"n": PT.shape[0], "nnz": int(PT.nnz), "dtype": np.dtype(dtype).name,
+                   "formato": "csr_transpuesta"}, f, indent=2)
+    return directorio
+
+class MatrizEnDisco:
+    """
+    Matriz abierta con np.load(mmap_mode="r"); bloques() entrega bloques de filas
+    de a lo sumo `memoria_bloque` bytes y cuenta los bytes leídos.
+    """
+
+    def __init__(self, ruta, memoria_bloque=MEMORIA_BLOQUE):
+        self.ruta = ruta
+        self.memoria_bloque = memoria_bloque
+        self.bytes_leidos = 0
+        if ruta.endswith(".npy"):
+            self.formato = "densa"
+            self._densa = np.load(ruta, mmap_mode="r")
+            if self._densa.ndim != 2 or self._densa.shape[0] != self._densa.shape[1]:
+                raise ValueError("El .npy debe contener una matriz cuadrada")
+            self.n = self._densa.shape[0]
+        else:
+            with open(os.path.join(ruta, "meta.json")) as f:
+                meta = json.load(f)
+            self.formato = meta["formato"]
+            self.n = meta["n"]
+            self._indptr = np.load(os.path.join(ruta, "indptr.npy"), mmap_mode="r")
+            self._indices = np.load(os.path.join(ruta, "indices.npy"), mmap_mode="r")
+            self._data = np.load(os.path.join(ruta, "data.npy"), mmap_mode="r")
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    def _cortes(self):
+        if self.formato == "densa":
+            filas = max(1, self.memoria_bloque // (self.n * self._densa.itemsize))
+            return np.append(np.arange(0, self.n, filas), self.n)
+        por_entrada = self._indices.itemsize + self._data.itemsize
+        objetivo = np.arange(0, self._indptr[-1], max(1, self.memoria_bloque // por_entrada))
+        cortes = np.searchsorted(self._indptr, objetivo, side="right") - 1
+        return np.unique(np.concatenate((cortes, [0, self.n])))
+
+    def bloques(self):
+        """Genera (a, b, bloque) con las filas a:b en float64 (densas o CSR)."""
+        cortes = self._cortes()
+        for a, b in zip(cortes[:-1], cortes[1:]):
+            if self.formato == "densa":
+                bloque = np.array(self._densa[a:b], dtype=np.float64)
+                self.bytes_leidos += bloque.shape[0] * self.n * self._densa.itemsize
+            else:
+                i, j = self._indptr[a], self._indptr[b]
+                indptr = np.array(self._indptr[a:b+1]) - i
+                bloque = sp.csr_matrix((np.array(self._data[i:j], dtype=np.float64),
+                                        np.array(self._indices[i:j]), indptr),
+                                       shape=(b - a, self.n))
+                self.bytes_leidos += (j - i) * (self._indices.itemsize + self._data.itemsize)
+            yield a, b, bloque
+
+def _barrido_potencias(disco, pi):
+    nuevo = np.zeros_like(pi)
+    for a, b, bloque in disco.bloques():
+        if disco.formato == "densa":
+            nuevo += pi[a:b] @ bloque
+        else:
+            nuevo[a:b] = bloque @ pi
+    return nuevo / np.sum(nuevo)
+
+def _barrido_gauss_seidel(disco, pi):
+    """
+    Gauss–Seidel sobre πⱼ = Σᵢ Pᵢⱼπᵢ: dentro de cada bloque de filas de Pᵀ se
+    resuelve el triángulo inferior (I - L)x = Uπ + resto, igual que metodo_sor.
+    El factor no se guarda entre barridos para no exceder la memoria del bloque.
+    """
+    pi = pi.copy()
+    for a, b, bloque in disco.bloques():
+        diagonal = bloque[:, a:b]
+        if np.any(diagonal.diagonal() >= 1.0):
+            raise ValueError("Gauss–Seidel requiere Pᵢᵢ < 1 (hay estados absorbentes)")
+        resto = bloque @ pi - diagonal @ pi[a:b]
+        izquierda = sp.identity(b - a, format="csr") - sp.tril(diagonal, format="csr")
+        derecha = sp.triu(diagonal, 1, format="csr") @ pi[a:b] + resto
+        pi[a:b] = spla.spsolve_triangular(izquierda, derecha, lower=True)
+    return pi / np.sum(pi)
+
+def _imprimir_progreso(k, residuo, info):
+    print(f"iter {k:>5}  cambio {residuo:.3e}  {info['mb_por_segundo']:.1f} MB/s",
+          file=sys.stderr)
+
+def calcular_distribucion_fuera_de_memoria(matriz, metodo="potencias", pi0=None, tol=1e-10,
+                                           max_iter=1000, memoria_bloque=MEMORIA_BLOQUE,
+                                           progreso=None):
+    """
+    Distribución estacionaria leyendo la matriz en disco por bloques de filas.
+    matriz: MatrizEnDisco o ruta (directorio CSR o .npy). metodo: "potencias" o
+    "gauss_seidel" (solo formato CSR de Pᵀ). progreso: True para imprimir cada
+    iteración o una función (k, cambio, info). Retorna (pi, info) con iteraciones,
+    cambios ‖πₖ - πₖ₋₁‖₁, tiempo, bytes leídos y MB/s de lectura.
+    """
+    disco = matriz if isinstance(matriz, MatrizEnDisco) else MatrizEnDisco(matriz, memoria_bloque)
+    if metodo == "gauss_seidel" and disco.formato == "densa":
+        raise ValueError("Gauss–Seidel necesita el formato CSR de Pᵀ (guardar_matriz_disco)")
+    barridos = {"potencias": _barrido_potencias, "gauss_seidel": _barrido_gauss_seidel}
+    if metodo not in barridos:
+        raise ValueError(f"Método desconocido: {metodo}")
+    if progreso is True:
+        progreso = _imprimir_progreso
+
+    inicio = time.perf_counter()
+    leidos = disco.bytes_leidos
+    pi = np.full(disco.n, 1.0 / disco.n) if pi0 is None else np.asarray(pi0, dtype=np.float64)
+    pi = pi / np.sum(pi)
+
+    residuos = []
+    for k in range(1, max_iter + 1):
+        nuevo = barridos[metodo](disco, pi)
+        residuos.append(float(np.sum(np.abs(nuevo - pi))))
+        pi = nuevo
+        tiempo = time.perf_counter() - inicio
+        info = {
+            "iteraciones": k,
+            "residuos": residuos,
+            "tiempo": tiempo,
+            "convergio": residuos[-1] < tol,
+            "bytes_leidos": disco.bytes_leidos - leidos,
+            "mb_por_segundo": (disco.bytes_leidos - leidos) / 2**20 / max(tiempo, 1e-12),
+        }
+        if progreso:
+            progreso(k, residuos[-1], info)
+        if info["convergio"]:
+            break
+    return pi, info
@@ -0,0 +1,170 @@
+"""
+Actualización incremental de π cuando cambian algunas filas de la cadena.
+Densa: Sherman–Morrison/Woodbury sobre Z = (I - P + 1aᵀ)⁻¹, O(n²) por fila.
+Dispersa: LU de la cadena base y corrección de Woodbury de rango (filas editadas),
+una resolución dispersa por edición. Se refactoriza cuando el tiempo acumulado en
+correcciones supera al de una factorización.
+"""
+
+import time
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .dispersa import _a_dispersa, _sistema_normalizado
+from .nacimiento_muerte import MatrizTridiagonal
+from .tiempos_paso import _matriz_fundamental
+
+class SolucionadorIncremental:
+    """
+    Mantiene π de la cadena actual bajo ediciones de filas.
+    Matrices densas usan la matriz fundamental; scipy.sparse o MatrizTridiagonal
+    usan la LU dispersa de la cadena base más una corrección de bajo rango.
+    """
+
+    def __init__(self, matriz, tol=1e-8):
+        self.dispersa = sp.issparse(matriz) or isinstance(matriz, MatrizTridiagonal)
+        self.P = _a_dispersa(matriz) if self.dispersa else np.array(matriz, dtype=np.float64)
+        self.n = self.P.shape[0]
+        self.tol = tol
+        self.refactorizaciones = 0
+        self._factorizar()
+
+    def _factorizar(self):
+        inicio = time.perf_counter()
+        if self.dispersa:
+            PT = self.P.T.tocsr()
+            A, k = _sistema_normalizado(PT)
+            self._lu = spla.splu(A)
+            self._k = k
+            self._mascara = np.ones(self.n)
+            self._mascara[k] = 0.0
+            e = np.zeros(self.n)
+            e[k] = 1.0
+            self._z = self._lu.solve(e)
+            self._factor = 1.0 + np.sum(self._z) - self._z[k]
+            self._base = self._resolver_base(e)
+            self._filas = {}
+            self._cambios = []
+            self._W = np.zeros((self.n, 0))
+        else:
+            self._Z, self._pi = _matriz_fundamental(self.P)
+        self._tiempo_factorizacion = time.perf_counter() - inicio
+        self._tiempo_correcciones = 0.0
+        self._pi_cache = None
+        self._residuo_base = self._residuo(self.distribucion())
+
+    def _resolver_base(self, r):
+        """B₀⁻¹r con B₀ = A' + eₖ(1 - eₖ)ᵀ (Sherman–Morrison sobre la LU de A')."""
+        y = self._lu.solve(r)
+        return y - self._z * (np.sum(y) - y[self._k]) / self._factor
+
+    def _validar(self, fila):
+        fila = np.asarray(fila, dtype=np.float64).ravel()
+        if fila.shape != (self.n,) or np.any(fila < 0) or abs(np.sum(fila) - 1.0) > 1e-12:
+            raise ValueError("Cada fila debe ser una distribución de probabilidad de longitud n")
+        return fila
+
+    def editar_filas(self, indices, filas):
+        """Reemplaza las filas `indices` de P por `filas` y actualiza π."""
+        indices = np.atleast_1d(indices)
+        filas = np.atleast_2d(filas)
+        if len(indices) != len(filas) or len(np.unique(indices)) != len(indices):
+            raise ValueError("Se espera una fila nueva por índice, sin repetir índices")
+        filas = [self._validar(f) for f in filas]
+
+        inicio = time.perf_counter()
+        if self.dispersa:
+            for i, fila in zip(indices, filas):
+                self._editar_dispersa(int(i), fila)
+        else:
+            self._editar_densa(indices, np.array(filas))
+        self._pi_cache = None
+        self._tiempo_correcciones += time.perf_counter() - inicio
+
+        if self._tiempo_correcciones > self._tiempo_factorizacion or not self._estable():
+            if self.dispersa:
+                self.P = self.matriz()
+            self.refactorizaciones += 1
+            self._factorizar()
+        return self
+
+    def editar_fila(self, i, fila):
+        """Reemplaza la fila i de P por `fila` y actualiza π."""
+        return self.editar_filas([i], [fila])
+
+    def _editar_densa(self, indices, filas):
+        """Woodbury: Z ← Z + Z[:, I](I - D Z[:, I])⁻¹ D Z, con D las diferencias de filas."""
+        D = filas - self.P[indices]
+        DZ = D @ self._Z
+        ZI = self._Z[:, indices]
+        C = np.linalg.solve(np.eye(len(indices)) - DZ[:, indices], DZ)
+        self._Z += ZI @ C
+        self._pi += self._pi[indices] @ C
+        self.P[indices] = filas
+
+    def _editar_dispersa(self, i, fila):
+        """
+        La columna i de Pᵀ cambia en d: B = B₀ + UVᵀ con u = -máscara∘d y v = eᵢ.
+        P no se modifica; las diferencias respecto de la base se guardan aparte.
+        """
+        if i in self._filas:
+            j = self._filas[i]
+            d = fila - self.P[i].toarray().ravel() - self._cambios[j]
+            self._cambios[j] += d
+            self._W[:, j] += self._resolver_base(-self._mascara * d)
+        else:
+            d = fila - self.P[i].toarray().ravel()
+            self._filas[i] = len(self._cambios)
+            self._cambios.append(d)
+            self._W = np.column_stack((self._W, self._resolver_base(-self._mascara * d)))
+
+    def matriz(self):
+        """Matriz de transición actual (dispersa con las ediciones aplicadas, o densa)."""
+        if not self.dispersa or not self._filas:
+            return self.P.copy()
+        filas = np.fromiter(self._filas, dtype=np.int64)
+        D = sp.csr_matrix(np.array(self._cambios))
+        E = sp.csr_matrix((np.ones(len(filas)), (filas, np.arange(len(filas)))),
+                          shape=(self.n, len(filas)))
+        P = (self.P + E @ D).tocsr()
+        P.eliminate_zeros()
+        return P
+
+    def _estable(self):
+        pi = self.distribucion()
+        return np.all(np.isfinite(pi)) and self._residuo(pi) <= max(self.tol, 10 * self._residuo_base)
+
+    def _residuo(self, pi):
+        """‖πP - π‖₁ sin materializar las ediciones dispersas."""
+        r = self.P.T @ pi - pi
+        if self.dispersa and self._filas:
+            filas = np.fromiter(self._filas, dtype=np.int64)
+            r += pi[filas] @ np.array(self._cambios)
+        return float(np.sum(np.abs(r)))
+
+    def distribucion(self):
+        """π de la cadena actual."""
+        if self._pi_cache is None:
+            if self.dispersa:
+                pi = self._base
+                if self._filas:
+                    V = np.fromiter(self._filas, dtype=np.int64)
+                    capacitancia = np.eye(len(V)) + self._W[V]
+                    pi = pi - self._W @ np.linalg.solve(capacitancia, pi[V])
+            else:
+                pi = self._pi
+            pi = np.abs(pi)
+            self._pi_cache = pi / np.sum(pi)
+        return self._pi_cache.copy()
+
+    def tiempos_medios_retorno(self):
+        """E[Tᵢ] = 1/πᵢ de la cadena actual."""
+        with np.errstate(divide="ignore"):
+            return 1.0 / self.distribucion()
+
+    @property
+    def ediciones_pendientes(self):
+        """Filas absorbidas por la corrección de bajo rango desde la última factorización."""
+        return len(self._filas) if self.dispersa else 0
@@ -0,0 +1,184 @@
+"""
+Solvers iterativos acelerados para la distribución estacionaria.
+Gauss–Seidel/SOR (ω fijo o estimado), extrapolación de Anderson y
+agregación–desagregación (KMS). Cada uno retorna (pi, info) con iteraciones,
+historial de residuos y tiempo.
+"""
+
+import time
+from functools import partial
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .dispersa import _a_dispersa
+
+def _inicial(n, pi0):
+    if pi0 is None:
+        return np.full(n, 1.0 / n)
+    pi = np.abs(np.asarray(pi0, dtype=np.float64))
+    return pi / np.sum(pi)
+
+def _residuo(PT, pi):
+    """‖πP - π‖₁."""
+    return float(np.sum(np.abs(PT @ pi - pi)))
+
+def _transpuesta(matriz):
+    """Pᵀ en CSR; un LinearOperator se toma tal cual (debe aplicar v ↦ vP)."""
+    if isinstance(matriz, spla.LinearOperator):
+        return matriz
+    return _a_dispersa(matriz).T.tocsr()
+
+def _info(iteraciones, residuos, inicio, tol):
+    return {
+        "iteraciones": iteraciones,
+        "residuos": residuos,
+        "tiempo": time.perf_counter() - inicio,
+        "convergio": bool(residuos) and residuos[-1] < tol,
+    }
+
+def _factor_sor(PT, omega):
+    """
+    Para A = I - Pᵀ = D - L - U, factoriza (D - ωL) una vez (triangular, sin relleno)
+    y retorna el barrido x ↦ (D - ωL)⁻¹[(1-ω)D + ωU]x.
+    """
+    A = sp.identity(PT.shape[0], format="csr") - PT
+    D = sp.diags(A.diagonal())
+    if np.any(A.diagonal() <= 0):
+        raise ValueError("Gauss–Seidel requiere Pᵢᵢ < 1 (hay estados absorbentes)")
+    izquierda = (D + omega * sp.tril(A, -1)).tocsc()
+    derecha = ((1 - omega) * D - omega * sp.triu(A, 1)).tocsr()
+    lu = spla.splu(izquierda, permc_spec="NATURAL", diag_pivot_thresh=0.0)
+    return lambda x: lu.solve(derecha @ x)
+
+def _omega_young(residuos):
+    """
+    ω = 2/(1 + √(1 - ρ)) con ρ la reducción media del residuo por barrido en la
+    segunda mitad de `residuos` (Gauss–Seidel); 1 si el residuo no bajó.
+    """
+    mitad = len(residuos) // 2
+    rho = (residuos[-1] / residuos[mitad]) ** (1.0 / max(len(residuos) - 1 - mitad, 1))
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho)) if 0 < rho < 1 else 1.0
+
+def metodo_sor(matriz, omega=1.0, pi0=None, tol=1e-12, max_iter=10000, pasos_omega=10):
+    """
+    Gauss–Seidel (omega=1) o SOR sobre (I - Pᵀ)π = 0, normalizando en cada barrido.
+    omega="auto" hace `pasos_omega` barridos de Gauss–Seidel, estima su factor de
+    convergencia ρ y sigue con ω = 2/(1 + √(1 - ρ)) (el óptimo de Young si la matriz
+    es consistentemente ordenada; en otras solo una estimación). info["omega"] es
+    el ω final.
+    """
+    inicio = time.perf_counter()
+    PT = _a_dispersa(matriz).T.tocsr()
+    automatico = isinstance(omega, str)
+    if automatico and omega != "auto":
+        raise ValueError(f"omega debe ser un número o 'auto': {omega}")
+    actual = 1.0 if automatico else omega
+    barrido = _factor_sor(PT, actual)
+    pi = _inicial(PT.shape[0], pi0)
+
+    residuos = []
+    for k in range(1, max_iter + 1):
+        pi = np.abs(barrido(pi))
+        pi /= np.sum(pi)
+        residuos.append(_residuo(PT, pi))
+        if residuos[-1] < tol:
+            break
+        if automatico and k == pasos_omega:
+            actual = _omega_young(residuos)
+            barrido = _factor_sor(PT, actual)
+    info = _info(k, residuos, inicio, tol)
+    info["omega"] = actual
+    return pi, info
+
+def metodo_anderson(matriz, memoria=5, pi0=None, tol=1e-12, max_iter=10000):
+    """
+    Iteración de potencias con extrapolación de Anderson de profundidad `memoria`.
+    matriz también puede ser un LinearOperator que aplica v ↦ vP (operadores estructurados).
+    """
+    inicio = time.perf_counter()
+    PT = _transpuesta(matriz)
+    pi = _inicial(PT.shape[0], pi0)
+
+    dG, dF = [], []
+    g_prev = f_prev = None
+    residuos = []
+    for k in range(1, max_iter + 1):
+        g = PT @ pi
+        g /= np.sum(g)
+        f = g - pi
+        residuos.append(float(np.sum(np.abs(f))))
+        if residuos[-1] < tol:
+            pi = g
+            break
+
+        if f_prev is not None:
+            dG.append(g - g_prev)
+            dF.append(f - f_prev)
+            if len(dF) > memoria:
+                dG.pop(0)
+                dF.pop(0)
+        g_prev, f_prev = g, f
+
+        if dF:
+            gamma = np.linalg.lstsq(np.column_stack(dF), f, rcond=None)[0]
+            nuevo = np.maximum(g - np.column_stack(dG) @ gamma, 0.0)
+            pi = nuevo / np.sum(nuevo) if np.sum(nuevo) > 0 else g
+        else:
+            pi = g
+    return pi, _info(k, residuos, inicio, tol)
+
+def _particion_contigua(n):
+    tam = int(np.ceil(np.sqrt(n)))
+    return np.arange(n) // tam
+
+def metodo_agregacion_desagregacion(matriz, particion=None, pi0=None, tol=1e-12,
+                                    max_iter=1000, omega=1.0):
+    """
+    Agregación–desagregación iterativa de Koury–McAllister–Stewart.
+    particion: etiqueta de bloque por estado (por defecto bloques contiguos de √n).
+    Cada iteración resuelve la cadena agregada k×k y suaviza con un barrido de SOR.
+    """
+    inicio = time.perf_counter()
+    P = _a_dispersa(matriz)
+    PT = P.T.tocsr()
+    n = P.shape[0]
+    etiquetas = np.unique(_particion_contigua(n) if particion is None else particion,
+                          return_inverse=True)[1]
+    k = etiquetas.max() + 1
+    S = sp.csr_matrix((np.ones(n), (np.arange(n), etiquetas)), shape=(n, k))
+    barrido = _factor_sor(PT, omega)
+    pi = _inicial(n, pi0)
+
+    residuos = []
+    for it in range(1, max_iter + 1):
+        masa = S.T @ pi
+        phi = pi / np.maximum(masa[etiquetas], 1e-300)
+        C = (S.T @ sp.diags(phi) @ P @ S).toarray()
+
+        A = C.T - np.eye(k)
+        A[-1, :] = 1.0
+        b = np.zeros(k)
+        b[-1] = 1.0
+        xi = np.abs(np.linalg.solve(A, b))
+
+        pi = np.abs(barrido(xi[etiquetas] * phi))
+        pi /= np.sum(pi)
+        residuos.append(_residuo(PT, pi))
+        if residuos[-1] < tol:
+            break
+    return pi, _info(it, residuos, inicio, tol)
+
+_METODOS = {
+    "gauss_seidel": metodo_sor,
+    "sor": partial(metodo_sor, omega="auto"),
+    "anderson": metodo_anderson,
+    "agregacion": metodo_agregacion_desagregacion,
+}
+
+def calcular_distribucion_iterativa(matriz, metodo="gauss_seidel", **opciones):
+    """Despacha a uno de los solvers iterativos y retorna (pi, info)."""
+    if metodo not in _METODOS:
+        raise ValueError(f"Método desconocido: {metodo}")
+    return _METODOS[metodo](matriz, **opciones)
@@ -0,0 +1,137 @@
+"""
+Cadenas producto en forma de Kronecker sin formar la matriz completa.
+P = w₀·(P₁ ⊗ … ⊗ P_k) + Σₜ wₜ·(A_{t,1} ⊗ … ⊗ A_{t,k}); los productos vector-matriz
+se hacen factor por factor sobre el tensor de estados (O(N·Σnᵢ) por término).
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .dispersa import calcular_distribucion_dispersa
+from .iterativos import metodo_anderson
+from .nacimiento_muerte import MatrizTridiagonal
+
+def _factor(A):
+    if isinstance(A, MatrizTridiagonal):
+        return A.a_dispersa()
+    if sp.issparse(A):
+        return A.tocsr().astype(np.float64)
+    return np.asarray(A, dtype=np.float64)
+
+def _aplicar_eje(X, A, eje):
+    """Contrae el eje `eje` del tensor X con A (X ↦ X ×ₑ Aᵀ, es decir v ↦ vA en ese eje)."""
+    X = np.moveaxis(X, eje, 0)
+    forma = X.shape
+    Y = (A.T @ X.reshape(forma[0], -1)).reshape(forma)
+    return np.moveaxis(Y, 0, eje)
+
+class MatrizKronecker:
+    """
+    Operador de transición de una cadena producto. factores: matrices de los
+    componentes independientes; acoplamientos: lista de (peso, [A₁, …, A_k]) con
+    una matriz estocástica por componente (None = identidad). El término
+    independiente recibe el peso 1 - Σ pesos.
+    """
+
+    def __init__(self, factores, acoplamientos=None):
+        self.factores = [_factor(A) for A in factores]
+        self.dimensiones = tuple(A.shape[0] for A in self.factores)
+        if any(A.shape != (m, m) for A, m in zip(self.factores, self.dimensiones)):
+            raise ValueError("Cada factor debe ser cuadrado")
+
+        self.acoplamientos = []
+        for peso, matrices in acoplamientos or []:
+            if len(matrices) != len(self.factores):
+                raise ValueError("Cada acoplamiento necesita una matriz por componente")
+            matrices = [None if A is None else _factor(A) for A in matrices]
+            if any(A is not None and A.shape != (m, m) for A, m in zip(matrices, self.dimensiones)):
+                raise ValueError("Las dimensiones del acoplamiento no coinciden con los factores")
+            self.acoplamientos.append((float(peso), matrices))
+        self.peso_independiente = 1.0 - sum(peso for peso, _ in self.acoplamientos)
+        if self.peso_independiente < 0:
+            raise ValueError("Los pesos de acoplamiento deben sumar a lo sumo 1")
+
+    @property
+    def n(self):
+        return int(np.prod(self.dimensiones))
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    @property
+    def separable(self):
+        return not self.acoplamientos
+
+    def _terminos(self):
+        yield self.peso_independiente, self.factores
+        yield from self.acoplamientos
+
+    def vecmat(self, v):
+        """Producto vP sin formar P."""
+        X = np.asarray(v, dtype=np.float64).reshape(self.dimensiones)
+        r = np.zeros(self.dimensiones)
+        for peso, matrices in self._terminos():
+            if peso == 0:
+                continue
+            Y = X
+            for eje, A in enumerate(matrices):
+                if A is not None:
+                    Y = _aplicar_eje(Y, A, eje)
+            r += peso * Y
+        return r.ravel()
+
+    def matvec(self, v):
+        """Producto Pv sin formar P."""
+        X = np.asarray(v, dtype=np.float64).reshape(self.dimensiones)
+        r = np.zeros(self.dimensiones)
+        for peso, matrices in self._terminos():
+            if peso == 0:
+                continue
+            Y = X
+            for eje, A in enumerate(matrices):
+                if A is not None:
+                    Y = _aplicar_eje(Y, A.T, eje)
+            r += peso * Y
+        return r.ravel()
+
+    def a_dispersa(self, formato="csr"):
+        """Matriz completa N×N (solo para cadenas pequeñas o pruebas)."""
+        total = sp.csr_matrix(self.shape)
+        for peso, matrices in self._terminos():
+            termino = sp.identity(1, format="csr")
+            for A, m in zip(matrices, self.dimensiones):
+                termino = sp.kron(termino, sp.identity(m) if A is None else sp.csr_matrix(A),
+                                  format="csr")
+            total = total + peso * termino
+        return total.asformat(formato)
+
+def _distribucion_factor(A):
+    if A.shape[0] == 1:
+        return np.ones(1)
+    return calcular_distribucion_dispersa(A)
+
+def _producto_tensorial(vectores):
+    pi = vectores[0]
+    for v in vectores[1:]:
+        pi = np.multiply.outer(pi, v)
+    return pi.ravel()
+
+def calcular_distribucion_kronecker(matriz, factorizada=False, tol=1e-12, max_iter=10000):
+    """
+    Distribución estacionaria de una MatrizKronecker.
+    Separable: π = π₁ ⊗ … ⊗ π_k, resolviendo solo los factores (O(N) para armarla;
+    con factorizada=True se retorna la lista de πᵢ sin formar π). Con acoplamientos:
+    Anderson sobre el operador estructurado, partiendo del producto de los πᵢ.
+    """
+    factores = [_distribucion_factor(A) for A in matriz.factores]
+    if matriz.separable:
+        return factores if factorizada else _producto_tensorial(factores)
+    if factorizada:
+        raise ValueError("Con acoplamientos π no se factoriza como producto tensorial")
+
+    operador = spla.LinearOperator(matriz.shape, matvec=matriz.vecmat, dtype=np.float64)
+    pi, _ = metodo_anderson(operador, pi0=_producto_tensorial(factores), tol=tol,
+                            max_iter=max_iter)
+    return pi
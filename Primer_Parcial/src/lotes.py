@@ -0,0 +1,94 @@
+"""
+Distribuciones estacionarias por lotes.
+Resuelve pilas (batch, n, n) con una llamada vectorizada por tamaño.
+"""
+
+import numpy as np
+
+from .clases import calcular_distribucion_por_clases
+from .markov_matrix import TOL_UNITARIO, _resolver_lu, calcular_distribucion_metodo_tiempo_retorno
+
+def crear_matrices_probabilidad_lote(n, ps):
+    """Pila (len(ps), n, n) de matrices de crear_matriz_probabilidad para varios p."""
+    ps = np.asarray(ps, dtype=np.float64)
+    if np.any((ps < 0) | (ps > 1)) or n <= 0:
+        raise ValueError("p debe estar en [0,1] y n>0")
+
+    P = np.zeros((ps.shape[0], n, n), dtype=np.float64)
+    if n == 1:
+        P[:, 0, 0] = 1.0
+        return P
+
+    filas = np.arange(n)
+    P[:, filas[1:], filas[:-1]] = (1 - ps)[:, None]
+    P[:, filas[:-1], filas[1:]] = ps[:, None]
+    P[:, 0, 0] = 1 - ps
+    P[:, n-1, n-1] = ps
+    return P
+
+def calcular_distribuciones_lote(matrices):
+    """
+    Distribuciones estacionarias de una pila (batch, n, n) con una LU por matriz.
+    Usa el sistema (Pᵀ - I)π = 0 con la última fila reemplazada por unos. Las
+    matrices con un pivote despreciable (varias clases cerradas) se resuelven por
+    clases con el Método 2.
+    """
+    P = np.asarray(matrices, dtype=np.float64)
+    if P.ndim != 3 or P.shape[1] != P.shape[2]:
+        raise ValueError("Se espera una pila de forma (batch, n, n)")
+
+    lote, n, _ = P.shape
+    A = np.swapaxes(P, 1, 2) - np.eye(n)
+    A[:, -1, :] = 1.0
+    b = np.zeros((lote, n), dtype=np.float64)
+    b[:, -1] = 1.0
+
+    pi, singulares = _resolver_lu(A, b)
+    pi = np.abs(pi)
+    pi /= np.sum(pi, axis=1, keepdims=True)
+    for i in np.flatnonzero(singulares):
+        pi[i] = calcular_distribucion_metodo_tiempo_retorno(P[i])
+    return pi
+
+def calcular_distribuciones_autovalores_lote(matrices):
+    """
+    Versión por lotes del Método 1: un único np.linalg.eig sobre la pila. Las
+    matrices con el valor propio 1 múltiple se resuelven por clases.
+    """
+    P = np.asarray(matrices, dtype=np.float64)
+    valores, vectores = np.linalg.eig(np.swapaxes(P, 1, 2))
+    idx = np.argmin(np.abs(valores - 1.0), axis=1)
+    pi = np.abs(np.real(np.take_along_axis(vectores, idx[:, None, None], axis=2)[..., 0]))
+    pi /= np.sum(pi, axis=1, keepdims=True)
+    multiples = np.count_nonzero(np.abs(valores - 1.0) < TOL_UNITARIO, axis=1) > 1
+    for i in np.flatnonzero(multiples):
+        pi[i] = calcular_distribucion_por_clases(P[i])["pi"]
+    return pi
+
+def calcular_distribuciones_parametros(parametros, metodo="sistema"):
+    """
+    Distribuciones para una lista de pares (n, p) de crear_matriz_probabilidad.
+    Agrupa por n y resuelve cada grupo como una sola pila. Retorna una lista en el
+    mismo orden de entrada.
+    """
+    if metodo not in _RESOLVEDORES_LOTE:
+        raise ValueError(f"Método desconocido: {metodo}")
+    resolver = _RESOLVEDORES_LOTE[metodo]
+    parametros = list(parametros)
+    resultados = [None] * len(parametros)
+
+    grupos = {}
+    for k, (n, p) in enumerate(parametros):
+        grupos.setdefault(int(n), []).append((k, p))
+
+    for n, miembros in grupos.items():
+        indices = [k for k, _ in miembros]
+        pis = resolver(crear_matrices_probabilidad_lote(n, [p for _, p in miembros]))
+        for k, pi in zip(indices, pis):
+            resultados[k] = pi
+    return resultados
+
+_RESOLVEDORES_LOTE = {
+    "sistema": calcular_distribuciones_lote,
+    "autovalores": calcular_distribuciones_autovalores_lote,
+}
@@ -3,17 +3,21 @@ Análisis Computacional de Cadenas de Markov
 Universidad Nacional de Colombia
 """
 
+import warnings
+
 import numpy as np
+import scipy.linalg as sla
+import scipy.sparse as sp
 
-def _initialize_gpu():
-    try:
-        import cupy as cp
-        cp.cuda.Device().compute_capability
-        return cp, True
-    except:
-        return None, False
+from .backend import cp, GPU_AVAILABLE, obtener_backend, a_host, limitar_hilos
+from .clases import descomponer_clases, calcular_distribucion_por_clases
+from .dispersa import PIVOTE_MIN, calcular_distribucion_dispersa
+from .kronecker import MatrizKronecker, calcular_distribucion_kronecker
+from .nacimiento_muerte import MatrizTridiagonal
+from .reordenamiento import calcular_distribucion_reordenada
+from .tiempos_paso import calcular_tiempos_medios_retorno, _distribucion_fundamental, _sistema_fundamental
 
-cp, GPU_AVAILABLE = _initialize_gpu()
+TOL_UNITARIO = 1e-8
 
 def crear_matriz_probabilidad(n, p):
     """Crea matriz de transición de n estados con probabilidad p."""
@@ -33,137 +37,141 @@ def crear_matriz_probabilidad(n, p):
     return P
 
 def calcular_distribucion_metodo_autovalores(matriz):
-    """Método 1: Vectores propios. Resuelve πP = π."""
+    """
+    Método 1: Vectores propios. Resuelve πP = π (producto tensorial de los factores si
+    es una MatrizKronecker). Si la matriz es dispersa el vector propio de λ=1 sale
+    del sistema de fila fijada de dispersa.py, una iteración inversa exacta que escala
+    mucho mejor que Arnoldi. Si el valor propio 1 es múltiple (varias clases
+    cerradas) se resuelve por clases.
+    """
+    if isinstance(matriz, MatrizKronecker):
+        return calcular_distribucion_kronecker(matriz)
+    if sp.issparse(matriz):
+        return calcular_distribucion_dispersa(matriz, metodo="directo")
     valores, vectores = np.linalg.eig(matriz.T)
+    if np.count_nonzero(np.abs(valores - 1.0) < TOL_UNITARIO) > 1:
+        return calcular_distribucion_por_clases(matriz)["pi"]
     idx = np.argmin(np.abs(valores - 1.0))
     pi = np.abs(np.real(vectores[:, idx]))
     return pi / np.sum(pi)
 
-def calcular_distribucion_metodo_tiempo_retorno(matriz):
-    """Método 2: Tiempos de retorno. Calcula πᵢ = 1/E[Tᵢ]."""
-    n = matriz.shape[0]
-    tiempos = np.zeros(n, dtype=np.float64)
-
-    for i in range(n):
-        idx = [j for j in range(n) if j != i]
-        if not idx:
-            tiempos[i] = 1.0
-            continue
-
-        P_red = matriz[np.ix_(idx, idx)]
-        A = np.eye(len(idx), dtype=np.float64) - P_red
-        b = np.ones(len(idx), dtype=np.float64)
+def _resolver_lu(A, b, xp=np):
+    """
+    x con Ax = b por LU, o None si algún pivote es despreciable frente al mayor (A
+    singular: varias clases cerradas, π no es única). Con NumPy acepta pilas
+    (lote, n, n) y retorna (x, singulares) con un booleano por matriz.
+    """
+    if xp is np:
+        linalg = sla
+    else:
+        import cupyx.scipy.linalg as linalg
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", sla.LinAlgWarning)
+        lu, piv = linalg.lu_factor(A, check_finite=False)
+    pivotes = xp.abs(xp.diagonal(lu, axis1=-2, axis2=-1))
+    singulares = pivotes.min(axis=-1) <= PIVOTE_MIN * A.shape[-1] * pivotes.max(axis=-1)
+    if A.ndim == 3:
+        x = linalg.lu_solve((lu, piv), b[..., None], check_finite=False)[..., 0]
+        return x, singulares
+    if bool(singulares):
+        return None
+    return linalg.lu_solve((lu, piv), b, check_finite=False)
+
+def _distribucion_unica(matriz, xp=np):
+    """
+    π = aᵀZ con la LU de (I - P + 1aᵀ)ᵀ, la misma factorización del Método 2. Si un
+    pivote es despreciable la matriz es singular (varias clases cerradas, π no es
+    única) y se retorna None; así no hace falta recorrer el grafo en el caso normal.
+    """
+    A, a = _sistema_fundamental(xp.asarray(matriz, dtype=xp.float64), xp)
+    pi = _resolver_lu(A.T, a, xp)
+    if pi is None or not bool(xp.all(xp.isfinite(pi))) or float(xp.min(pi)) < -1e-8:
+        return None
+    return pi
 
+def calcular_distribucion_metodo_tiempo_retorno(matriz, reordenar=False):
+    """
+    Método 2: Tiempos de retorno. Calcula πᵢ = 1/E[Tᵢ] con una sola factorización.
+    Si la factorización es singular o da masa negativa (varias clases cerradas) se
+    resuelve cada clase en su bloque y se combinan con las probabilidades de
+    absorción desde un estado uniforme.
+    reordenar=True permuta los estados con Cuthill–McKee inverso y resuelve con un
+    solver de banda o LU dispersa (ver reordenamiento.py).
+    """
+    if isinstance(matriz, MatrizTridiagonal):
+        tiempos = calcular_tiempos_medios_retorno(matriz)
+    elif reordenar:
+        clases = descomponer_clases(matriz)
+        if len(clases["cerradas"]) > 1:
+            return calcular_distribucion_por_clases(matriz, clases)["pi"]
         try:
-            h = np.linalg.solve(A, b)
-        except np.linalg.LinAlgError:
-            h = _resolver_iterativo(P_red, b)
-
-        tiempos[i] = 1.0 + sum(matriz[i, j] * h[k] for k, j in enumerate(idx))
+            return calcular_distribucion_reordenada(matriz)[0]
+        except (np.linalg.LinAlgError, RuntimeError):
+            return calcular_distribucion_por_clases(matriz, clases)["pi"]
+    else:
+        pi = _distribucion_unica(matriz)
+        if pi is None:
+            return calcular_distribucion_por_clases(matriz)["pi"]
+        with np.errstate(divide="ignore"):
+            tiempos = 1.0 / np.maximum(pi, 0.0)
 
     pi = 1.0 / np.maximum(tiempos, 1e-15)
     pi = np.abs(pi) / np.sum(np.abs(pi))
 
     if np.any(np.isnan(pi)):
-        return _metodo_potencias(matriz)
+        return calcular_distribucion_por_clases(matriz)["pi"]
     return pi
 
-def _resolver_iterativo(P_red, b, max_iter=5000, tol=1e-12):
-    h = np.ones(len(b), dtype=np.float64)
-    for _ in range(max_iter):
-        h_new = P_red @ h + b
-        if np.linalg.norm(h_new - h) < tol:
-            break
-        h = h_new
-    return h
-
-def _metodo_potencias(matriz, max_iter=10000, tol=1e-12):
-    n = matriz.shape[0]
-    pi = np.ones(n, dtype=np.float64) / n
-    for _ in range(max_iter):
-        pi_new = pi @ matriz
-        pi_new /= np.sum(pi_new)
-        if np.max(np.abs(pi_new - pi)) < tol:
-            break
-        pi = pi_new
+def _sistema_directo(P, xp):
+    """
+    Resuelve (Pᵀ - I)π = 0 reemplazando la última fila por unos (normalización).
+    Retorna None si el sistema es singular (varias clases cerradas).
+    """
+    n = P.shape[0]
+    A = P.T - xp.eye(n, dtype=xp.float64)
+    A[-1, :] = 1.0
+    b = xp.zeros(n, dtype=xp.float64)
+    b[-1] = 1.0
+    pi = _resolver_lu(A, b, xp)
+    if pi is None:
+        return None
+    return xp.abs(pi) / xp.sum(xp.abs(pi))
+
+def calcular_distribucion_sistema_directo(matriz, backend="auto", hilos=None):
+    """
+    Sistema lineal directo en el backend elegido ("auto", "numpy" o "cupy").
+    En CPU, hilos fija el número de hilos BLAS. Si el sistema es singular (varias
+    clases cerradas) se resuelve por clases. Retorna un arreglo NumPy.
+    """
+    xp = obtener_backend(backend)
+    with limitar_hilos(hilos):
+        P = xp.asarray(matriz, dtype=xp.float64)
+        pi = _sistema_directo(P, xp)
+    if pi is None:
+        return calcular_distribucion_por_clases(a_host(P))["pi"]
+    return a_host(pi)
+
+def calcular_distribucion_metodo_autovalores_gpu(matriz, hilos=None):
+    """Versión GPU del Método 1 (NumPy multihilo si no hay GPU)."""
+    return calcular_distribucion_sistema_directo(matriz, "auto", hilos)
+
+def calcular_distribucion_metodo_tiempo_retorno_gpu(matriz, hilos=None, reordenar=False):
+    """
+    Versión GPU del Método 2 (NumPy multihilo si no hay GPU). El solve denso no
+    aprovecha el orden de los estados, así que reordenar=True usa la versión de CPU
+    con la permutación de Cuthill–McKee inverso. Si la factorización es singular se
+    usa la versión de CPU, que resuelve por clases.
+    """
+    if reordenar:
+        return calcular_distribucion_metodo_tiempo_retorno(matriz, reordenar=True)
+    xp = obtener_backend("auto")
+    with limitar_hilos(hilos):
+        pi = _distribucion_unica(matriz, xp)
+    if pi is None:
+        return calcular_distribucion_metodo_tiempo_retorno(a_host(matriz))
+    pi = a_host(xp.abs(pi) / xp.sum(xp.abs(pi)))
     return pi
 
-def calcular_distribucion_metodo_autovalores_gpu(matriz):
-    """Versión GPU del Método 1."""
-    if not GPU_AVAILABLE:
-        raise RuntimeError("GPU no disponible")
-
-    P_gpu = cp.asarray(matriz, dtype=cp.float64)
-    n = P_gpu.shape[0]
-
-    try:
-        A = P_gpu.T - cp.eye(n, dtype=cp.float64)
-        A[-1, :] = 1.0
-        b = cp.zeros(n, dtype=cp.float64)
-        b[-1] = 1.0
-        pi = cp.linalg.solve(A, b)
-        pi = cp.abs(pi) / cp.sum(cp.abs(pi))
-        return cp.asnumpy(pi)
-    except cp.linalg.LinAlgError:
-        return _metodo_potencias_gpu(P_gpu)
-
-def _metodo_potencias_gpu(P_gpu, max_iter=1000, tol=1e-12):
-    n = P_gpu.shape[0]
-    pi = cp.random.random(n, dtype=cp.float64)
-    pi /= cp.sum(pi)
-    PT = P_gpu.T
-    for _ in range(max_iter):
-        pi_new = pi @ PT
-        pi_new /= cp.sum(pi_new)
-        if cp.linalg.norm(pi_new - pi) < tol:
-            break
-        pi = pi_new
-    return cp.asnumpy(pi)
-
-def calcular_distribucion_metodo_tiempo_retorno_gpu(matriz):
-    """Versión GPU del Método 2."""
-    if not GPU_AVAILABLE:
-        raise RuntimeError("GPU no disponible")
-    if matriz.shape[0] > 200:
-        return calcular_distribucion_metodo_tiempo_retorno(matriz)
-
-    P_gpu = cp.asarray(matriz, dtype=cp.float64)
-    n = P_gpu.shape[0]
-
-    try:
-        tiempos = cp.zeros(n, dtype=cp.float64)
-        for i in range(n):
-            idx = [j for j in range(n) if j != i]
-            if not idx:
-                tiempos[i] = 1.0
-                continue
-
-            idx_gpu = cp.array(idx)
-            P_red = P_gpu[cp.ix_(idx_gpu, idx_gpu)]
-            A = cp.eye(len(idx), dtype=cp.float64) - P_red
-            b = cp.ones(len(idx), dtype=cp.float64)
-
-            try:
-                h = cp.linalg.solve(A, b)
-            except cp.linalg.LinAlgError:
-                h = _resolver_iterativo_gpu(P_red, b)
-
-            tiempos[i] = 1.0 + sum(P_gpu[i, j] * h[k] for k, j in enumerate(idx))
-
-        pi = 1.0 / tiempos
-        return cp.asnumpy(pi / cp.sum(pi))
-    except Exception:
-        return calcular_distribucion_metodo_tiempo_retorno(matriz)
-
-def _resolver_iterativo_gpu(P_red, b, max_iter=5000, tol=1e-12):
-    h = cp.ones(len(b), dtype=cp.float64)
-    for _ in range(max_iter):
-        h_new = P_red @ h + b
-        if cp.linalg.norm(h_new - h) < tol:
-            break
-        h = h_new
-    return h
-
 def get_gpu_info():
     """Retorna información de GPU disponible."""
     if not GPU_AVAILABLE:
@@ -193,7 +201,16 @@ def clear_gpu_memory():
     return False
 
 def recomendar_metodo(n):
-    """Recomienda método óptimo según tamaño de matriz."""
+    """Recomienda método óptimo según tamaño de matriz (usa el perfil calibrado si existe)."""
+    from .calibracion import cargar_perfil, _tiempo_estimado
+
+    perfil = cargar_perfil()
+    if perfil is not None:
+        gpu = _tiempo_estimado(perfil, "sistema_directo_gpu", n)
+        cpu = min(_tiempo_estimado(perfil, nombre, n)
+                  for nombre in ("autovalores", "sistema_directo"))
+        return {"metodo1": "GPU" if gpu < cpu else "CPU", "metodo2": "CPU"}
+
     if not GPU_AVAILABLE:
         return {"metodo1": "CPU", "metodo2": "CPU"}
     if n <= 50:
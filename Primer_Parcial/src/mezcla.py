@@ -0,0 +1,268 @@
+"""
+Brecha espectral y tiempos de mezcla.
+Estima |λ₂| (segundo mayor módulo), el tiempo de relajación y una cota del tiempo
+de mezcla en variación total sin calcular el espectro completo. La curva exacta
+d(t) = maxᵢ‖Pᵗ(i,·) - π‖_TV se obtiene por elevación al cuadrado repetida.
+"""
+
+import numpy as np
+import scipy.linalg as sla
+import scipy.sparse.linalg as spla
+
+from .calibracion import calcular_distribucion
+from .clases import descomponer_clases
+from .dispersa import _a_dispersa, calcular_distribucion_dispersa
+from .nacimiento_muerte import MatrizTridiagonal, _log_distribucion
+from .transitorio import _PotenciasDiadicas
+
+MAX_DENSA = 1000
+PASOS_POTENCIA = 1000
+
+def _espectro_tridiagonal(matriz):
+    """
+    Extremos del espectro de una cadena de nacimiento y muerte irreducible.
+    S = D^½PD^-½ es simétrica tridiagonal; bisección LAPACK en O(n) por autovalor.
+    """
+    n = matriz.n
+    fuera = np.sqrt(matriz.superior * matriz.inferior)
+    superiores = sla.eigh_tridiagonal(matriz.diagonal, fuera, eigvals_only=True,
+                                      select="i", select_range=(n - 2, n - 1))
+    inferior = sla.eigh_tridiagonal(matriz.diagonal, fuera, eigvals_only=True,
+                                    select="i", select_range=(0, 0))
+    return np.concatenate((superiores[::-1], inferior))
+
+def _log_pi_min(pi):
+    pi = np.abs(np.real(pi))
+    with np.errstate(divide="ignore"):
+        return np.log(np.min(pi) / np.sum(pi))
+
+def _como_tridiagonal(P):
+    """MatrizTridiagonal si la matriz dispersa solo tiene las tres diagonales centrales."""
+    filas, columnas = P.nonzero()
+    if np.any(np.abs(filas - columnas) > 1):
+        return None
+    return MatrizTridiagonal(P.diagonal(-1), P.diagonal(), P.diagonal(1))
+
+def _distribucion_potencias(PT, tol, max_iter):
+    """π por iteración de potencia (hasta ‖πₜ₊₁ - πₜ‖₁ < tol), o None si no converge."""
+    pi = np.full(PT.shape[0], 1.0 / PT.shape[0])
+    for _ in range(max_iter):
+        siguiente = PT @ pi
+        if np.sum(np.abs(siguiente - pi)) < tol:
+            return siguiente / np.sum(siguiente)
+        pi = siguiente
+    return None
+
+def _espectro_deflactado(P, k, tol, ncv, max_iter):
+    """
+    Autovalores de mayor módulo de Pᵀ - w1ᵀ (deflación de Wielandt: espectro
+    {0, λ₂, …, λₙ} para cualquier w con suma 1; con w ≈ π queda casi normal).
+    Retorna (autovalores con el 1 al frente, π, convergió). Varias clases cerradas
+    o periodo d > 1 dan |λ₂| = 1 sin Arnoldi (y π = None); si ARPACK no converge
+    en max_iter reinicios se usa la cota trivial |λ₂| ≤ 1.
+    """
+    n = P.shape[0]
+    clases = descomponer_clases(P, periodos=True)
+    if len(clases["cerradas"]) > 1:
+        return np.ones(2), None, True
+    d = clases["periodos"][0]
+    if d > 1:
+        return np.array([1.0, np.exp(2j * np.pi / d)]), None, True
+
+    PT = P.T.tocsr()
+    pi = _distribucion_potencias(PT, 1e-12, PASOS_POTENCIA)
+    if pi is None:
+        pi = calcular_distribucion_dispersa(P)
+    deflactada = spla.LinearOperator((n, n), matvec=lambda x: PT @ x - pi * np.sum(x),
+                                     dtype=np.float64)
+    try:
+        resto = spla.eigs(deflactada, k=min(max(k - 1, 1), n - 2), which="LM", tol=tol,
+                          ncv=min(n, max(ncv, 2 * k + 1)), maxiter=max_iter,
+                          v0=np.random.default_rng(0).random(n), return_eigenvectors=False)
+    except spla.ArpackNoConvergence:
+        return np.ones(2), pi, False
+    return np.concatenate(([1.0], resto)), pi, True
+
+def estimar_brecha_espectral(matriz, epsilon=0.25, k=2, reversible=None, tol=1e-6, ncv=40,
+                             max_iter=1000):
+    """
+    Retorna un dict con el segundo mayor módulo de autovalor (lambda2), la brecha
+    absoluta, el tiempo de relajación t_rel = 1/(1-|λ₂|) y la cota
+    t_mix(ε) ≤ ⌈t_rel·log(1/(ε·π_min))⌉ (válida para cadenas reversibles).
+    Tridiagonal: bisección O(n) sobre la simetrizada. Reversible: Lanczos sobre
+    √(P∘Pᵀ). General: Arnoldi sobre Pᵀ - π1ᵀ, con π por iteración de potencia, así
+    |λ₂| es el autovalor dominante y no compite con el 1. tol (precisión relativa
+    de los autovalores), ncv (vectores de Lanczos/Arnoldi; más vectores separan
+    mejor módulos parecidos) y max_iter (reinicios) controlan ARPACK; si no
+    converge, "convergio" es False y lambda2 = 1. Matrices pequeñas usan el
+    espectro completo.
+    """
+    convergio = True
+    if not isinstance(matriz, MatrizTridiagonal):
+        P = _a_dispersa(matriz)
+        matriz = _como_tridiagonal(P) or P
+
+    if isinstance(matriz, MatrizTridiagonal):
+        if np.any(matriz.superior <= 0) or np.any(matriz.inferior <= 0):
+            raise ValueError("La cadena de nacimiento y muerte debe ser irreducible")
+        autovalores = _espectro_tridiagonal(matriz)
+        _, _, log_pi = _log_distribucion(matriz)
+        log_pi_min = log_pi.min() - np.log(np.sum(np.exp(log_pi)))
+        reversible = True
+    else:
+        n = matriz.shape[0]
+        if reversible:
+            # Para P reversible el autovector de λ=1 de √(P∘Pᵀ) es √π.
+            S = matriz.multiply(matriz.T).sqrt().tocsr()
+            try:
+                if n <= max(MAX_DENSA, k + 2):
+                    autovalores, vectores = np.linalg.eigh(S.toarray())
+                else:
+                    autovalores, vectores = spla.eigsh(S, k=min(k, n - 2), which="LM", tol=tol,
+                                                       ncv=min(n, max(ncv, 2 * k + 1)),
+                                                       maxiter=max_iter)
+                v = vectores[:, np.argmin(np.abs(autovalores - 1.0))]
+                log_pi_min = _log_pi_min(v * v)
+            except spla.ArpackNoConvergence:
+                autovalores, convergio = np.ones(2), False
+                log_pi_min = _log_pi_min(calcular_distribucion_dispersa(matriz))
+        elif n <= max(MAX_DENSA, k + 2):
+            autovalores, vectores = np.linalg.eig(matriz.T.toarray())
+            log_pi_min = _log_pi_min(vectores[:, np.argmin(np.abs(autovalores - 1.0))])
+        else:
+            autovalores, pi, convergio = _espectro_deflactado(matriz, k, tol, ncv, max_iter)
+            # Sin π (|λ₂| = 1) la cota es infinita con cualquier π_min ≤ 1/n.
+            log_pi_min = -np.log(n) if pi is None else _log_pi_min(pi)
+
+    autovalores = np.asarray(autovalores)
+    autovalores = autovalores[np.argsort(-np.abs(autovalores))]
+    resto = np.delete(autovalores, np.argmin(np.abs(autovalores - 1.0)))
+    lambda2 = float(np.max(np.abs(resto))) if resto.size else 0.0
+
+    brecha = 1.0 - lambda2
+    t_rel = np.inf if brecha <= 0 else 1.0 / brecha
+    return {
+        "lambda2": lambda2,
+        "autovalores": autovalores,
+        "brecha": brecha,
+        "tiempo_relajacion": t_rel,
+        "tiempo_mezcla": float(np.ceil(t_rel * (np.log(1.0 / epsilon) - log_pi_min))),
+        "epsilon": epsilon,
+        "reversible": bool(reversible),
+        "convergio": convergio,
+    }
+
+def _distancia_tv(filas, pi):
+    """max sobre las filas de ½‖fila - π‖₁."""
+    return float(0.5 * np.max(np.sum(np.abs(filas - pi), axis=1)))
+
+def _biseccion(potencias, pi, epsilon, curva, k, limite):
+    """
+    Primer t ≤ limite con d(t) < ε sabiendo que d(2^k) ≥ ε > d(limite) y
+    limite ≤ 2^(k+1): compone P^(2^k) con las potencias diádicas menores.
+    """
+    t, actual = 2 ** k, potencias[k]
+    for j in range(k - 1, -1, -1):
+        if t + 2 ** j >= limite:
+            continue
+        candidata = actual @ potencias[j]
+        curva[t + 2 ** j] = _distancia_tv(candidata, pi)
+        if curva[t + 2 ** j] >= epsilon:
+            t, actual = t + 2 ** j, candidata
+    return t + 1
+
+def _curva_potencias(P, pi, epsilon, t_max, refinar):
+    """
+    d(2^k) con P^(2^k) = (P^(2^(k-1)))², hasta bajar de ε. Como d(t) es no creciente,
+    el primer t con d(t) < ε está en (2^(k-1), 2^k] y se ubica por bisección
+    componiendo P^(2^(k-1)) con las potencias diádicas menores: O(n³ log t) en total.
+    Si la siguiente potencia pasa de t_max, se evalúa d(t_max) y se busca en
+    (2^k, t_max] antes de dar por no alcanzado ε.
+    """
+    potencias = _PotenciasDiadicas(P)
+    curva = {}
+    k = 0
+    while True:
+        curva[2 ** k] = _distancia_tv(potencias[k], pi)
+        if curva[2 ** k] < epsilon:
+            if not refinar or k == 0:
+                return curva, 2 ** k
+            return curva, _biseccion(potencias, pi, epsilon, curva, k - 1, 2 ** k)
+        if 2 ** (k + 1) > t_max:
+            break
+        k += 1
+
+    resto = t_max - 2 ** k
+    if resto == 0:
+        return curva, None
+    final = potencias[k]
+    for j in range(k):
+        if resto >> j & 1:
+            final = final @ potencias[j]
+    curva[t_max] = _distancia_tv(final, pi)
+    if curva[t_max] >= epsilon:
+        return curva, None
+    if not refinar:
+        return curva, t_max
+    return curva, _biseccion(potencias, pi, epsilon, curva, k, t_max)
+
+def _curva_muestreada(P, pi, inicios, epsilon, t_max):
+    """
+    Propaga solo las filas de `inicios` con productos dispersos, O(m·nnz) por paso.
+    d(t) se evalúa en cada paso, así que el primer cruce es exacto para esas filas.
+    """
+    PT = P.T.tocsr()
+    X = np.zeros((P.shape[0], inicios.size))
+    X[inicios, np.arange(inicios.size)] = 1.0
+    curva = {}
+    for t in range(1, t_max + 1):
+        X = PT @ X
+        curva[t] = _distancia_tv(X.T, pi)
+        if curva[t] < epsilon:
+            return curva, t
+    return curva, None
+
+def curva_variacion_total(matriz, epsilon=0.25, t_max=10**6, refinar=True, inicios=None,
+                          metodo="auto", semilla=None):
+    """
+    Curva d(t) = maxᵢ‖Pᵗ(i,·) - π‖_TV y primer t con d(t) < ε.
+    metodo="potencias": P^(2^k) densas por elevación al cuadrado (todas las filas),
+    rejilla diádica más, si refinar=True, los puntos de la bisección que ubican el
+    cruce exacto; con refinar=False el tiempo es la cota diádica 2^k (o t_max).
+    metodo="muestreo": solo las filas de `inicios` (índices, o un entero m para m
+    estados al azar; por defecto 64), propagadas con productos dispersos en cada t;
+    el máximo sobre una muestra es una cota inferior de d(t).
+    "auto" usa potencias si n ≤ MAX_DENSA y no se pasaron inicios.
+    Retorna un dict con "t", "d" (ordenados por t), "tiempo_mezcla" (None si no se
+    alcanza ε antes de t_max), "epsilon" e "inicios" (None = todos los estados).
+    """
+    if metodo not in ("auto", "potencias", "muestreo"):
+        raise ValueError(f"Método desconocido: {metodo}")
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon debe estar en (0, 1)")
+    P = _a_dispersa(matriz)
+    n = P.shape[0]
+    pi = calcular_distribucion(P)
+    if metodo == "auto":
+        metodo = "potencias" if n <= MAX_DENSA and inicios is None else "muestreo"
+
+    if metodo == "potencias":
+        curva, t_mix = _curva_potencias(P, pi, epsilon, t_max, refinar)
+        inicios = None
+    else:
+        if inicios is None or np.ndim(inicios) == 0:
+            m = min(n, 64 if inicios is None else int(inicios))
+            inicios = np.random.default_rng(semilla).choice(n, size=m, replace=False)
+        inicios = np.unique(np.asarray(inicios, dtype=np.int64))
+        if inicios.size == 0 or inicios.min() < 0 or inicios.max() >= n:
+            raise ValueError("Los estados iniciales deben estar en 0..n-1")
+        curva, t_mix = _curva_muestreada(P, pi, inicios, epsilon, t_max)
+
+    t = np.array(sorted(curva), dtype=np.int64)
+    return {
+        "t": t,
+        "d": np.array([curva[x] for x in t]),
+        "tiempo_mezcla": t_mix,
+        "epsilon": epsilon,
+        "inicios": inicios,
+    }
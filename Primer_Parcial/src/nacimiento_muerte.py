@@ -0,0 +1,150 @@
+"""
+Cadenas de nacimiento y muerte en representación tridiagonal.
+Permite resolver la distribución estacionaria en O(n) usando balance detallado.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+class MatrizTridiagonal:
+    """Matriz de transición tridiagonal guardada por sus tres diagonales."""
+
+    def __init__(self, inferior, diagonal, superior):
+        self.inferior = np.asarray(inferior, dtype=np.float64)
+        self.diagonal = np.asarray(diagonal, dtype=np.float64)
+        self.superior = np.asarray(superior, dtype=np.float64)
+        n = self.diagonal.shape[0]
+        if n == 0 or self.inferior.shape != (n-1,) or self.superior.shape != (n-1,):
+            raise ValueError("Las diagonales deben tener longitudes n-1, n, n-1 con n>0")
+
+    @property
+    def n(self):
+        return self.diagonal.shape[0]
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    @classmethod
+    def desde_densa(cls, matriz, tol=0.0):
+        """Extrae las diagonales de una matriz densa, verificando que sea tridiagonal."""
+        matriz = np.asarray(matriz, dtype=np.float64)
+        fuera = np.triu(matriz, 2) + np.tril(matriz, -2)
+        if np.any(np.abs(fuera) > tol):
+            raise ValueError("La matriz no es tridiagonal")
+        return cls(np.diag(matriz, -1), np.diag(matriz), np.diag(matriz, 1))
+
+    def a_densa(self):
+        """Retorna la matriz densa n×n equivalente."""
+        return self.a_dispersa().toarray()
+
+    def a_dispersa(self, formato="csr"):
+        """Retorna la matriz como scipy.sparse en el formato pedido."""
+        return sp.diags([self.inferior, self.diagonal, self.superior], [-1, 0, 1],
+                        shape=self.shape, format=formato)
+
+    def vecmat(self, v):
+        """Producto por la izquierda vP en O(n)."""
+        v = np.asarray(v, dtype=np.float64)
+        r = v * self.diagonal
+        r[1:] += v[:-1] * self.superior
+        r[:-1] += v[1:] * self.inferior
+        return r
+
+    def matvec(self, v):
+        """Producto por la derecha Pv en O(n)."""
+        v = np.asarray(v, dtype=np.float64)
+        r = self.diagonal * v
+        r[:-1] += self.superior * v[1:]
+        r[1:] += self.inferior * v[:-1]
+        return r
+
+def crear_matriz_probabilidad_banda(n, p):
+    """Versión tridiagonal de crear_matriz_probabilidad, en O(n) memoria."""
+    if not 0 <= p <= 1 or n <= 0:
+        raise ValueError("p debe estar en [0,1] y n>0")
+
+    diagonal = np.zeros(n, dtype=np.float64)
+    if n == 1:
+        diagonal[0] = 1.0
+        return MatrizTridiagonal(np.empty(0), diagonal, np.empty(0))
+
+    diagonal[0], diagonal[-1] = 1-p, p
+    return MatrizTridiagonal(np.full(n-1, 1-p), diagonal, np.full(n-1, p))
+
+def _clases_cerradas(inferior, superior):
+    """Inicios y finales de los intervalos [a, b] que son clases cerradas."""
+    n = superior.shape[0] + 1
+    cortes = np.flatnonzero((superior <= 0) | (inferior <= 0))
+    inicios = np.concatenate(([0], cortes + 1))
+    finales = np.concatenate((cortes, [n-1]))
+
+    sin_bajada = np.ones(inicios.shape[0], dtype=bool)
+    sin_bajada[1:] = inferior[inicios[1:] - 1] <= 0
+    sin_subida = np.ones(finales.shape[0], dtype=bool)
+    sin_subida[:-1] = superior[finales[:-1]] <= 0
+
+    cerradas = sin_bajada & sin_subida
+    return inicios[cerradas], finales[cerradas]
+
+def _clase_cerrada(inferior, superior):
+    """Primer intervalo [a, b] que forma una clase cerrada de la cadena tridiagonal."""
+    inicios, finales = _clases_cerradas(inferior, superior)
+    return inicios[0], finales[0]
+
+def _log_bloque(matriz, a, b):
+    """log π̃ en la clase cerrada [a, b], sin normalizar y con máximo 0."""
+    log_pi = np.zeros(b - a + 1, dtype=np.float64)
+    np.cumsum(np.log(matriz.superior[a:b]) - np.log(matriz.inferior[a:b]), out=log_pi[1:])
+    log_pi -= log_pi.max()
+    return log_pi
+
+def _pesos_absorcion(matriz, inicios, finales):
+    """
+    Probabilidad de terminar en cada clase cerrada desde un estado uniforme:
+    (|C| + 1ᵀ(I - Q)⁻¹R_C)/n con un solo solve tridiagonal yᵀ(I - Q) = 1ᵀ.
+    """
+    n = matriz.n
+    clase = np.full(n, -1, dtype=np.int64)
+    for k, (a, b) in enumerate(zip(inicios, finales)):
+        clase[a:b+1] = k
+    pesos = (finales - inicios + 1).astype(np.float64)
+
+    transitorios = np.flatnonzero(clase < 0)
+    if transitorios.size:
+        P = matriz.a_dispersa()
+        A = sp.identity(transitorios.size, format="csc") - P[transitorios][:, transitorios]
+        y = spla.splu(A.T.tocsc(), permc_spec="NATURAL").solve(np.ones(transitorios.size))
+        flujo = P[transitorios].T @ y
+        cerrados = clase >= 0
+        pesos += np.bincount(clase[cerrados], weights=flujo[cerrados], minlength=inicios.size)
+    return pesos / n
+
+def _log_distribucion(matriz):
+    """(a, b, log π̃) en la clase cerrada [a, b], con log π̃ sin normalizar y máximo 0."""
+    a, b = _clase_cerrada(matriz.inferior, matriz.superior)
+    return a, b, _log_bloque(matriz, a, b)
+
+def calcular_distribucion_nacimiento_muerte(matriz):
+    """
+    Distribución estacionaria por balance detallado: πᵢ₊₁ = πᵢ·P[i,i+1]/P[i+1,i].
+    Trabaja en escala logarítmica para evitar desbordes con n grande. Acepta una
+    MatrizTridiagonal o una matriz densa tridiagonal. Si hay varias clases cerradas
+    se combina la distribución de cada una con su probabilidad de absorción desde
+    un estado uniforme, como calcular_distribucion_por_clases.
+    """
+    if not isinstance(matriz, MatrizTridiagonal):
+        matriz = MatrizTridiagonal.desde_densa(matriz)
+
+    pi = np.zeros(matriz.n, dtype=np.float64)
+    if matriz.n == 1:
+        pi[0] = 1.0
+        return pi
+
+    inicios, finales = _clases_cerradas(matriz.inferior, matriz.superior)
+    pesos = _pesos_absorcion(matriz, inicios, finales) if inicios.size > 1 else [1.0]
+    for a, b, peso in zip(inicios, finales, pesos):
+        bloque = np.exp(_log_bloque(matriz, a, b))
+        pi[a:b+1] = peso * bloque / np.sum(bloque)
+    return pi
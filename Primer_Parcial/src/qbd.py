@@ -0,0 +1,199 @@
+"""
+Procesos cuasi nacimiento y muerte (QBD) en tiempo discreto.
+La matriz es tridiagonal por bloques con bloques repetidos A0 (subir un nivel),
+A1 (quedarse) y A2 (bajar). Para infinitos niveles se calcula G por reducción
+logarítmica y R a partir de G, y π_{k+1} = π_k R; el costo no depende del número
+de niveles. Para finitos niveles se eliminan los bloques desde el último nivel, O(N m³).
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+def _bloque(A, filas, columnas, nombre):
+    A = np.asarray(A, dtype=np.float64)
+    if A.shape != (filas, columnas):
+        raise ValueError(f"{nombre} debe ser {filas}x{columnas}")
+    if np.any(A < 0):
+        raise ValueError(f"{nombre} tiene entradas negativas")
+    return A
+
+def _estocastica(*bloques, nombre):
+    if not np.allclose(sum(B.sum(axis=1) for B in bloques), 1.0, atol=1e-10):
+        raise ValueError(f"Las filas del nivel {nombre} no suman 1")
+
+def _bloques(A0, A1, A2, B0, B1, B2):
+    """Valida y completa los bloques: por defecto B0 = A0, B1 = A1 + A2, B2 = A2."""
+    A1 = np.asarray(A1, dtype=np.float64)
+    m = A1.shape[0]
+    A0, A1, A2 = (_bloque(A, m, m, nombre) for A, nombre in ((A0, "A0"), (A1, "A1"), (A2, "A2")))
+    B1 = A1 + A2 if B1 is None else np.asarray(B1, dtype=np.float64)
+    m0 = B1.shape[0]
+    B1 = _bloque(B1, m0, m0, "B1")
+    B0 = _bloque(A0 if B0 is None else B0, m0, m, "B0")
+    B2 = _bloque(A2 if B2 is None else B2, m, m0, "B2")
+    _estocastica(A0, A1, A2, nombre="repetido")
+    _estocastica(B0, B1, nombre="0")
+    _estocastica(B2, A1, A0, nombre="1")
+    return A0, A1, A2, B0, B1, B2
+
+def matriz_g(A0, A1, A2, tol=1e-14, max_iter=100):
+    """
+    Mínima solución no negativa de G = A2 + A1 G + A0 G² por reducción logarítmica
+    (Latouche–Ramaswami): cada iteración duplica los niveles considerados, así que
+    converge cuadráticamente. Retorna (G, iteraciones).
+    """
+    m = A1.shape[0]
+    I = np.eye(m)
+    L = np.linalg.inv(I - A1)
+    subir, bajar = L @ A0, L @ A2
+    G, T = bajar.copy(), subir.copy()
+    for iteracion in range(1, max_iter + 1):
+        U = subir @ bajar + bajar @ subir
+        M = np.linalg.inv(I - U)
+        subir, bajar = M @ subir @ subir, M @ bajar @ bajar
+        G += T @ bajar
+        T = T @ subir
+        if np.max(np.abs(1.0 - G.sum(axis=1))) < tol:
+            return G, iteracion
+    return G, max_iter
+
+def _deriva(A0, A2):
+    """π_A A0 1 - π_A A2 1, con π_A la distribución de A = A0 + A1 + A2 (negativa ⇒ estable)."""
+    A = A0 + A2
+    A = A + np.diag(1.0 - A.sum(axis=1))
+    m = A.shape[0]
+    sistema = (np.eye(m) - A).T
+    sistema[-1] = 1.0
+    b = np.zeros(m)
+    b[-1] = 1.0
+    pi_A = np.linalg.solve(sistema, b)
+    return float(pi_A @ A0.sum(axis=1) - pi_A @ A2.sum(axis=1))
+
+def _frontera(B0, B1, B2, local, normalizacion):
+    """
+    Resuelve π0 = π0 B1 + π1 B2, π1 = π0 B0 + π1·local con π0 1 + π1·normalizacion = 1.
+    """
+    m0, m = B0.shape
+    P = np.block([[B1, B0], [B2, local]])
+    sistema = (np.eye(m0 + m) - P).T
+    sistema[-1] = np.concatenate((np.ones(m0), normalizacion))
+    b = np.zeros(m0 + m)
+    b[-1] = 1.0
+    x = np.linalg.solve(sistema, b)
+    return x[:m0], x[m0:]
+
+class DistribucionQBD:
+    """
+    Distribución estacionaria de un QBD por niveles. pi0 es el nivel frontera;
+    nivel(k) para k ≥ 1. Si niveles es None (infinitos), π_k = π1 R^(k-1).
+    """
+
+    def __init__(self, pi0, pi1, R=None, G=None, niveles=None, superiores=None, iteraciones=0):
+        self.pi0 = pi0
+        self.pi1 = pi1
+        self.R = R
+        self.G = G
+        self.niveles = niveles
+        self._superiores = superiores
+        self.iteraciones = iteraciones
+
+    def nivel(self, k):
+        """Vector π_k de las fases del nivel k."""
+        if k == 0:
+            return self.pi0.copy()
+        if k < 0 or (self.niveles is not None and k > self.niveles):
+            raise ValueError("Nivel fuera de rango")
+        if self.niveles is not None:
+            return self._superiores[k - 1].copy()
+        return self.pi1 @ np.linalg.matrix_power(self.R, k - 1)
+
+    def niveles_hasta(self, k_max):
+        """Arreglo (k_max) × m con π_1, ..., π_k_max (sin el nivel frontera)."""
+        if self.niveles is not None:
+            return self._superiores[:k_max].copy()
+        filas = [self.pi1]
+        for _ in range(k_max - 1):
+            filas.append(filas[-1] @ self.R)
+        return np.array(filas)
+
+    def masa_niveles(self, k_max):
+        """P(nivel = k) para k = 0..k_max."""
+        return np.concatenate(([self.pi0.sum()], self.niveles_hasta(k_max).sum(axis=1)))
+
+    def nivel_medio(self):
+        """E[nivel]; para infinitos niveles es π1 (I - R)⁻² 1."""
+        if self.niveles is not None:
+            return float(np.arange(1, self.niveles + 1) @ self._superiores.sum(axis=1))
+        m = self.R.shape[0]
+        N = np.linalg.inv(np.eye(m) - self.R)
+        return float(self.pi1 @ N @ N.sum(axis=1))
+
+    def a_vector(self, k_max=None):
+        """π plano (nivel 0, nivel 1, ...) hasta k_max, o todos si la cadena es finita."""
+        k_max = self.niveles if k_max is None else k_max
+        return np.concatenate((self.pi0, self.niveles_hasta(k_max).ravel()))
+
+def calcular_distribucion_qbd(A0, A1, A2, B0=None, B1=None, B2=None, niveles=None, C1=None,
+                              tol=1e-14, max_iter=100):
+    """
+    Distribución estacionaria de un QBD discreto.
+    A0, A1, A2: bloques m×m repetidos (subir, quedarse, bajar) para niveles ≥ 1.
+    B1 (m0×m0) y B0 (m0×m): nivel 0; B2 (m×m0): del nivel 1 al 0.
+    niveles=None: infinitos niveles, requiere deriva π_A A0 1 < π_A A2 1; G por
+    reducción logarítmica, R = A0 (I - A1 - A0 G)⁻¹.
+    niveles=N: niveles 0..N con bloque local C1 en el nivel N (por defecto A1 + A0,
+    las subidas se quedan); se eliminan los niveles de arriba hacia abajo,
+    R_k = A0 (I - A1 - R_{k+1} A2)⁻¹, en O(N m³).
+    Retorna un DistribucionQBD.
+    """
+    A0, A1, A2, B0, B1, B2 = _bloques(A0, A1, A2, B0, B1, B2)
+    m = A1.shape[0]
+    I = np.eye(m)
+
+    if niveles is None:
+        if _deriva(A0, A2) >= 0:
+            raise ValueError("El QBD no es positivo recurrente: la deriva hacia arriba no es negativa")
+        G, iteraciones = matriz_g(A0, A1, A2, tol, max_iter)
+        R = A0 @ np.linalg.inv(I - A1 - A0 @ G)
+        normalizacion = np.linalg.solve(I - R, np.ones(m))
+        pi0, pi1 = _frontera(B0, B1, B2, A1 + R @ A2, normalizacion)
+        return DistribucionQBD(pi0, pi1, R=R, G=G, iteraciones=iteraciones)
+
+    if niveles < 1:
+        raise ValueError("Se necesita al menos un nivel además del nivel 0")
+    C1 = A1 + A0 if C1 is None else _bloque(C1, m, m, "C1")
+    _estocastica(A2 if niveles > 1 else B2, C1, nombre=str(niveles))
+
+    # R[k] lleva π_{k-1} a π_k, para k = niveles..2.
+    Rs = {}
+    local = C1
+    for k in range(niveles, 1, -1):
+        Rs[k] = A0 @ np.linalg.inv(I - local)
+        local = A1 + Rs[k] @ A2
+
+    # π1·(1 + R2 1 + R2R3 1 + ...) da la masa de los niveles ≥ 1.
+    normalizacion = np.ones(m)
+    for k in range(niveles, 1, -1):
+        normalizacion = np.ones(m) + Rs[k] @ normalizacion
+    pi0, pi1 = _frontera(B0, B1, B2, local, normalizacion)
+
+    superiores = np.empty((niveles, m))
+    superiores[0] = pi1
+    for k in range(2, niveles + 1):
+        superiores[k - 1] = superiores[k - 2] @ Rs[k]
+    return DistribucionQBD(pi0, pi1, niveles=niveles, superiores=superiores)
+
+def ensamblar_qbd(A0, A1, A2, niveles, B0=None, B1=None, B2=None, C1=None):
+    """Matriz dispersa completa de un QBD finito con niveles 0..niveles, para comparar."""
+    A0, A1, A2, B0, B1, B2 = _bloques(A0, A1, A2, B0, B1, B2)
+    C1 = A1 + A0 if C1 is None else np.asarray(C1, dtype=np.float64)
+    filas = [[None] * (niveles + 1) for _ in range(niveles + 1)]
+    A0, A1, A2, B0, B1, B2, C1 = (sp.csr_matrix(B) for B in (A0, A1, A2, B0, B1, B2, C1))
+    filas[0][0], filas[0][1], filas[1][0] = B1, B0, B2
+    for k in range(1, niveles + 1):
+        filas[k][k] = C1 if k == niveles else A1
+        if k < niveles:
+            filas[k][k + 1] = A0
+        if k > 1:
+            filas[k][k - 1] = A2
+    return sp.bmat(filas, format="csr")
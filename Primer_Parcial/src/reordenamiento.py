@@ -0,0 +1,118 @@
+"""
+Reordenamiento de estados antes de los solves directos.
+Cuthill–McKee inverso sobre el grafo de transiciones reduce el ancho de banda de
+cadenas con banda pero estados desordenados; el sistema permutado se resuelve con
+un solver de banda O(n b²) o con LU dispersa, y π se devuelve en el orden original.
+"""
+
+import time
+
+import numpy as np
+import scipy.linalg as sla
+import scipy.sparse.csgraph as csgraph
+import scipy.sparse.linalg as spla
+
+from .dispersa import _a_dispersa, _normalizar, _sistema_normalizado
+
+MAX_BANDA = 200
+
+def permutacion_rcm(matriz):
+    """Permutación de Cuthill–McKee inverso del patrón simétrico P + Pᵀ."""
+    P = _a_dispersa(matriz)
+    patron = (abs(P) + abs(P.T)).tocsr()
+    return csgraph.reverse_cuthill_mckee(patron, symmetric_mode=True).astype(np.int64)
+
+def ancho_banda(matriz):
+    """(inferior, superior): mayor distancia a la diagonal debajo y encima de ella."""
+    P = _a_dispersa(matriz).tocoo()
+    if P.nnz == 0:
+        return 0, 0
+    distancia = P.row - P.col
+    return int(max(distancia.max(), 0)), int(max(-distancia.min(), 0))
+
+def _permutar(P, p):
+    return P[p][:, p].tocsr()
+
+def _resolver_banda(A, k, inferior, superior):
+    """A'x = eₖ con A' guardada en formato de banda de LAPACK."""
+    A = A.tocoo()
+    n = A.shape[0]
+    banda = np.zeros((inferior + superior + 1, n))
+    np.add.at(banda, (superior + A.row - A.col, A.col), A.data)
+    e = np.zeros(n)
+    e[k] = 1.0
+    return sla.solve_banded((inferior, superior), banda, e, check_finite=False)
+
+def _resolver_lu(A, k, permc_spec):
+    e = np.zeros(A.shape[0])
+    e[k] = 1.0
+    lu = spla.splu(A, permc_spec=permc_spec)
+    return lu.solve(e), lu.L.nnz + lu.U.nnz
+
+def _resolver(P, resolver, permc_spec):
+    """π de P con el sistema de fila fijada; retorna (pi, resolver usado, relleno)."""
+    A, k = _sistema_normalizado(P.T.tocsr())
+    inferior, superior = ancho_banda(A)
+    if resolver == "auto":
+        resolver = "banda" if max(inferior, superior) <= MAX_BANDA else "lu"
+    if resolver == "banda":
+        x = _resolver_banda(A, k, inferior, superior)
+        relleno = (2 * inferior + superior + 1) * A.shape[0]
+    else:
+        x, relleno = _resolver_lu(A, k, permc_spec)
+    return _normalizar(x), resolver, relleno
+
+def calcular_distribucion_reordenada(matriz, orden="rcm", resolver="auto", comparar=False):
+    """
+    Distribución estacionaria resolviendo en una base permutada.
+    orden: "rcm" (Cuthill–McKee inverso), "colamd" (orden de columnas de SuperLU que
+    reduce el relleno, sin permutar los estados), "natural" o un arreglo con la
+    permutación. resolver: "banda" (solve_banded sobre el ancho de banda resultante),
+    "lu" (splu sin reordenar columnas) o "auto" (banda si el ancho es ≤ MAX_BANDA).
+    Retorna (pi, info) con el orden, el resolver usado, los anchos de banda antes y
+    después, el relleno (nnz(L) + nnz(U), o el tamaño de la banda) y el tiempo; con
+    comparar=True agrega el relleno, el tiempo y la diferencia con una LU en el orden
+    original, y la aceleración.
+    """
+    inicio = time.perf_counter()
+    P = _a_dispersa(matriz)
+    n = P.shape[0]
+    permc_spec = "NATURAL"
+    if isinstance(orden, str):
+        if orden == "rcm":
+            p = permutacion_rcm(P)
+        elif orden in ("natural", "colamd"):
+            p = np.arange(n)
+            if orden == "colamd":
+                permc_spec, resolver = "COLAMD", "lu"
+        else:
+            raise ValueError(f"Orden desconocido: {orden}")
+    else:
+        p = np.asarray(orden, dtype=np.int64)
+        if not np.array_equal(np.sort(p), np.arange(n)):
+            raise ValueError("La permutación debe contener cada estado una vez")
+    if resolver not in ("auto", "banda", "lu"):
+        raise ValueError(f"Resolver desconocido: {resolver}")
+
+    P_permutada = _permutar(P, p)
+    pi_permutada, usado, relleno = _resolver(P_permutada, resolver, permc_spec)
+    pi = np.empty(n)
+    pi[p] = pi_permutada
+    info = {
+        "orden": orden if isinstance(orden, str) else "dado",
+        "resolver": usado,
+        "ancho_banda_original": max(ancho_banda(P)),
+        "ancho_banda": max(ancho_banda(P_permutada)),
+        "relleno": int(relleno),
+        "tiempo": time.perf_counter() - inicio,
+        "permutacion": p,
+    }
+
+    if comparar:
+        inicio = time.perf_counter()
+        referencia, _, relleno_original = _resolver(P, "lu", "NATURAL")
+        info["tiempo_original"] = time.perf_counter() - inicio
+        info["relleno_original"] = int(relleno_original)
+        info["aceleracion"] = info["tiempo_original"] / info["tiempo"]
+        info["diferencia"] = float(np.max(np.abs(pi - referencia)))
+    return pi, info
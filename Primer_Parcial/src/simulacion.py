@@ -0,0 +1,160 @@
+"""
+Simulación de trayectorias con muchos caminantes independientes a la vez.
+Las tablas de alias (Walker/Vose) se construyen una vez por fila; cada paso avanza
+todos los caminantes con un muestreo O(1) vectorizado. Las estadísticas se
+acumulan en línea, sin guardar trayectorias.
+"""
+
+import numpy as np
+
+from .dispersa import _a_dispersa
+
+class TablaAlias:
+    """Tablas de alias por fila sobre las entradas no nulas de P (rellenadas a K)."""
+
+    def __init__(self, matriz):
+        P = _a_dispersa(matriz)
+        P.sum_duplicates()
+        P.eliminate_zeros()
+        n = P.shape[0]
+        largos = np.diff(P.indptr)
+        if np.any(largos == 0):
+            raise ValueError("Todas las filas deben tener alguna transición")
+        K = int(largos.max())
+
+        filas = np.repeat(np.arange(n), largos)
+        posicion = np.arange(P.nnz) - P.indptr[filas]
+        columnas = np.zeros((n, K), dtype=np.int64)
+        q = np.zeros((n, K), dtype=np.float64)
+        columnas[filas, posicion] = P.indices
+        q[filas, posicion] = P.data
+        q *= K / q.sum(axis=1, keepdims=True)
+
+        orden = np.argsort(q, axis=1, kind="stable")
+        self.columnas = np.take_along_axis(columnas, orden, axis=1)
+        q = np.take_along_axis(q, orden, axis=1)
+        self.umbral, alias = self._construir(q)
+        self.alias = np.take_along_axis(self.columnas, alias, axis=1)
+        self.n, self.K = n, K
+
+    @staticmethod
+    def _construir(q):
+        """
+        Vose con los pesos ordenados, en paralelo sobre las filas: los pequeños se
+        emparejan en orden con el grande actual l, y si l queda por debajo de 1 pasa
+        a ser el siguiente pequeño. Cada paso fija una columna de cada fila.
+        """
+        n, K = q.shape
+        umbral = np.ones((n, K), dtype=np.float64)
+        alias = np.tile(np.arange(K), (n, 1))
+        filas = np.arange(n)
+        pequenos = np.sum(q < 1.0, axis=1)
+        s = np.zeros(n, dtype=np.int64)
+        l = np.minimum(pequenos, K - 1)
+
+        for _ in range(K - 1):
+            grande = q[filas, l]
+            pasa = (grande < 1.0) & (l < K - 1)
+            toma = (grande >= 1.0) & (s < pequenos)
+            f = np.flatnonzero(pasa | toma)
+            if f.size == 0:
+                break
+            chico = np.where(pasa[f], l[f], s[f])
+            l[f] += pasa[f]
+            s[f] += toma[f]
+            umbral[f, chico] = q[f, chico]
+            alias[f, chico] = l[f]
+            q[f, l[f]] -= 1.0 - q[f, chico]
+        return umbral, alias
+
+    def muestrear(self, estados, rng):
+        """Un paso de la cadena desde cada estado del arreglo."""
+        k = rng.integers(0, self.K, size=estados.shape[0])
+        propio = rng.random(estados.shape[0]) < self.umbral[estados, k]
+        return np.where(propio, self.columnas[estados, k], self.alias[estados, k])
+
+class SimuladorCaminantes:
+    """
+    Avanza `caminantes` trayectorias independientes en paralelo.
+    Cada caminante tiene como ancla su estado inicial y registra su primer retorno a
+    ella: son muestras i.i.d. de T_j. Mientras algún caminante de un ancla no haya
+    vuelto, su T_j está censurado en t y solo se reporta una cota inferior de E_j[T_j].
+    También acumula las frecuencias de ocupación de todos los estados.
+    inicio: estado común, arreglo de estados, o None (caminante w empieza en w mod n).
+    """
+
+    def __init__(self, matriz, caminantes=100000, inicio=None, semilla=None):
+        self.tabla = matriz if isinstance(matriz, TablaAlias) else TablaAlias(matriz)
+        n = self.tabla.n
+        if inicio is None:
+            inicio = np.arange(caminantes) % n
+        inicio = np.broadcast_to(np.asarray(inicio, dtype=np.int64), (caminantes,))
+        if np.any((inicio < 0) | (inicio >= n)):
+            raise ValueError("Estados iniciales fuera de rango")
+
+        self.rng = np.random.default_rng(semilla)
+        self.estados = inicio.copy()
+        self.anclas = inicio.copy()
+        self.t = 0
+        self._pendiente = np.ones(caminantes, dtype=bool)
+        self.ocupacion = np.zeros(n, dtype=np.int64)
+        self.pasos_registrados = 0
+        self._retornos = np.zeros(n, dtype=np.int64)
+        self._suma = np.zeros(n, dtype=np.float64)
+        self._suma_cuadrados = np.zeros(n, dtype=np.float64)
+
+    @property
+    def caminantes(self):
+        return self.estados.shape[0]
+
+    def avanzar(self, pasos=1, registrar_ocupacion=True):
+        """Avanza todos los caminantes; con registrar_ocupacion=False sirve de calentamiento."""
+        n = self.tabla.n
+        for _ in range(pasos):
+            self.estados = self.tabla.muestrear(self.estados, self.rng)
+            self.t += 1
+            if registrar_ocupacion:
+                self.ocupacion += np.bincount(self.estados, minlength=n)
+                self.pasos_registrados += 1
+
+            volvio = np.flatnonzero(self._pendiente & (self.estados == self.anclas))
+            if volvio.size:
+                ancla = self.anclas[volvio]
+                self._retornos += np.bincount(ancla, minlength=n)
+                self._suma += self.t * np.bincount(ancla, minlength=n)
+                self._suma_cuadrados += self.t**2 * np.bincount(ancla, minlength=n)
+                self._pendiente[volvio] = False
+        return self
+
+    def frecuencias(self):
+        """Fracción del tiempo registrado que los caminantes pasaron en cada estado."""
+        if self.pasos_registrados == 0:
+            raise ValueError("No hay pasos registrados")
+        return self.ocupacion / (self.pasos_registrados * self.caminantes)
+
+    def tiempos_retorno(self):
+        """
+        Dict por estado ancla con "media" (E_j[T_j] estimado) y "error" (error
+        estándar), solo si todos sus caminantes ya volvieron y NaN en otro caso;
+        "cota_inferior" (promedio de min(T_j, t), siempre ≤ E_j[T_j] en media),
+        "retornos" (muestras) y "pendientes" (caminantes aún sin volver).
+        """
+        n = self.tabla.n
+        m = self._retornos
+        pendientes = np.bincount(self.anclas[self._pendiente], minlength=n)
+        total = m + pendientes
+        completos = (m > 0) & (pendientes == 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            media = np.where(completos, self._suma / m, np.nan)
+            varianza = np.where(completos & (m > 1),
+                                (self._suma_cuadrados - m * media**2) / (m - 1), np.nan)
+            error = np.sqrt(np.maximum(varianza, 0.0) / m)
+            cota = np.where(total > 0, (self._suma + pendientes * self.t) / total, np.nan)
+        return {"media": media, "error": error, "cota_inferior": cota, "retornos": m.copy(),
+                "pendientes": pendientes}
+
+def simular_distribucion(matriz, pasos, caminantes=100000, calentamiento=0, semilla=None):
+    """Distribución estacionaria empírica (frecuencias de ocupación) por simulación."""
+    simulador = SimuladorCaminantes(matriz, caminantes, semilla=semilla)
+    simulador.avanzar(calentamiento, registrar_ocupacion=False)
+    return simulador.avanzar(pasos).frecuencias()
@@ -0,0 +1,103 @@
+"""
+Cadenas de Markov en tiempo continuo a partir del generador Q.
+Distribución estacionaria (πQ = 0) y transitoria p(t) = p(0)e^{Qt} por
+uniformización P = I + Q/Λ con truncamiento de Poisson de Fox–Glynn.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from .dispersa import calcular_distribucion_dispersa
+
+def _generador(Q, tol=1e-10):
+    """Q en CSR, verificando filas que suman cero y tasas fuera de la diagonal ≥ 0."""
+    Q = sp.csr_matrix(Q, dtype=np.float64)
+    if Q.shape[0] != Q.shape[1]:
+        raise ValueError("El generador debe ser cuadrado")
+    fuera = Q - sp.diags(Q.diagonal())
+    escala = max(1.0, np.max(np.abs(Q.diagonal()), initial=0.0))
+    if fuera.nnz and fuera.data.min() < 0:
+        raise ValueError("Las tasas fuera de la diagonal deben ser no negativas")
+    if np.max(np.abs(np.asarray(Q.sum(axis=1)).ravel())) > tol * escala:
+        raise ValueError("Las filas del generador deben sumar cero")
+    return Q
+
+def uniformizar(Q, factor=1.02):
+    """(P, Λ) con P = I + Q/Λ y Λ = factor·max|qᵢᵢ| (factor > 1 evita periodicidad)."""
+    Q = _generador(Q)
+    tasa = factor * np.max(np.abs(Q.diagonal()), initial=0.0)
+    if tasa == 0:
+        return sp.identity(Q.shape[0], format="csr"), 0.0
+    return (sp.identity(Q.shape[0], format="csr") + Q / tasa).tocsr(), tasa
+
+def pesos_fox_glynn(lam, epsilon=1e-10):
+    """
+    Puntos de truncamiento (L, R) y pesos de Poisson(λ) con masa fuera de [L, R]
+    menor que ε. Como en Fox–Glynn, los pesos se generan desde la moda con la
+    recurrencia w_{k±1} = w_k·(λ/(k+1) | k/λ) en escala relativa, sin desbordes
+    para λ grande, y luego se normalizan.
+    """
+    if lam < 0:
+        raise ValueError("λ debe ser no negativo")
+    if lam == 0:
+        return 0, 0, np.ones(1)
+
+    moda = int(np.floor(lam))
+    c = np.sqrt(2.0 * np.log(2.0 / epsilon)) + 3.0
+    izquierda = max(0, int(np.floor(moda - c * np.sqrt(lam))))
+    derecha = int(np.ceil(moda + c * np.sqrt(lam) + c * c))
+
+    pesos = np.empty(derecha - izquierda + 1)
+    m = moda - izquierda
+    pesos[m] = 1.0
+    for k in range(moda, izquierda, -1):
+        pesos[k - 1 - izquierda] = pesos[k - izquierda] * k / lam
+    for k in range(moda, derecha):
+        pesos[k + 1 - izquierda] = pesos[k - izquierda] * lam / (k + 1)
+    pesos /= np.sum(pesos)
+
+    cola = epsilon / 2
+    L = int(np.searchsorted(np.cumsum(pesos), cola, side="right"))
+    R = len(pesos) - 1 - int(np.searchsorted(np.cumsum(pesos[::-1]), cola, side="right"))
+    return izquierda + L, izquierda + R, pesos[L:R + 1]
+
+def calcular_distribucion_tiempo_continuo(Q):
+    """Distribución estacionaria πQ = 0 (la misma que la de la cadena uniformizada)."""
+    P, _ = uniformizar(Q)
+    return calcular_distribucion_dispersa(P)
+
+def _paso_uniformizado(PT, p, lam, epsilon):
+    L, R, pesos = pesos_fox_glynn(lam, epsilon)
+    v = p.copy()
+    resultado = np.zeros_like(p)
+    for k in range(R + 1):
+        if k >= L:
+            resultado += pesos[k - L] * v
+        if k < R:
+            v = PT @ v
+    return resultado
+
+def iterar_transitorio_continuo(Q, p0, tiempos, epsilon=1e-10):
+    """
+    Generador de (t, p(t)) para los tiempos en orden creciente. Avanza desde el
+    tiempo anterior con e^{QΔt}, a razón de R(ΛΔt) ≈ ΛΔt + O(√(ΛΔt)) productos
+    dispersos por salto; el error en norma 1 es a lo sumo ε por salto.
+    """
+    P, tasa = uniformizar(Q)
+    PT = P.T.tocsr()
+    p = np.asarray(p0, dtype=np.float64).copy()
+    if p.shape != (P.shape[0],):
+        raise ValueError("p0 debe tener longitud n")
+
+    t_actual = 0.0
+    for t in np.unique(np.asarray(tiempos, dtype=np.float64)):
+        if t < 0:
+            raise ValueError("Los tiempos deben ser no negativos")
+        p = _paso_uniformizado(PT, p, tasa * (t - t_actual), epsilon)
+        t_actual = float(t)
+        yield t_actual, p
+
+def distribucion_transitoria_continua(Q, p0, t, epsilon=1e-10):
+    """p(t) = p(0)e^{Qt} por uniformización con truncamiento de Fox–Glynn."""
+    for _, p in iterar_transitorio_continuo(Q, p0, [t], epsilon):
+        return p
@@ -0,0 +1,183 @@
+"""
+Tiempos medios de retorno y de primer paso con una sola factorización.
+Usa la matriz fundamental generalizada Z = (I - P + 1aᵀ)⁻¹ con aᵀ1 = 1.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse as sp
+
+from .nacimiento_muerte import MatrizTridiagonal, calcular_distribucion_nacimiento_muerte
+
+def _sistema_fundamental(matriz, xp=np):
+    """Construye A = I - P + 1aᵀ con a uniforme; su inversa es la matriz fundamental."""
+    n = matriz.shape[0]
+    a = xp.full(n, 1.0 / n, dtype=xp.float64)
+    A = xp.eye(n, dtype=xp.float64) - matriz
+    A += a[None, :]
+    return A, a
+
+def _distribucion_fundamental(matriz, xp=np):
+    """π = aᵀZ resolviendo un único sistema Aᵀπ = a."""
+    A, a = _sistema_fundamental(xp.asarray(matriz, dtype=xp.float64), xp)
+    return xp.linalg.solve(A.T, a)
+
+def _matriz_fundamental(matriz):
+    """Z = (I - P + 1aᵀ)⁻¹ y π = aᵀZ."""
+    A, a = _sistema_fundamental(np.asarray(matriz, dtype=np.float64))
+    Z = np.linalg.inv(A)
+    return Z, a @ Z
+
+def calcular_tiempos_medios_retorno(matriz):
+    """
+    Tiempos medios de retorno E[Tᵢ] = 1/πᵢ (lema de Kac) para todos los estados.
+    O(n³) para matrices densas y O(n) para MatrizTridiagonal.
+    """
+    if isinstance(matriz, MatrizTridiagonal):
+        pi = calcular_distribucion_nacimiento_muerte(matriz)
+    else:
+        pi = np.maximum(_distribucion_fundamental(matriz), 0.0)
+    with np.errstate(divide="ignore"):
+        return 1.0 / pi
+
+def calcular_matriz_primer_paso(matriz):
+    """
+    Matriz M con M[i,j] = E_i[T_j] y M[j,j] = tiempo medio de retorno.
+    Densa: mᵢⱼ = (zⱼⱼ - zᵢⱼ)/πⱼ a partir de una factorización. Tridiagonal: sumas
+    acumuladas de los pasos entre vecinos (O(n) de trabajo más la salida n×n).
+    """
+    if isinstance(matriz, MatrizTridiagonal):
+        return _matriz_primer_paso_tridiagonal(matriz)
+
+    Z, pi = _matriz_fundamental(matriz)
+    M = (np.diag(Z)[None, :] - Z) / pi[None, :]
+    M[np.diag_indices_from(M)] = 1.0 / pi
+    return M
+
+def _matriz_primer_paso_tridiagonal(matriz):
+    pi = calcular_distribucion_nacimiento_muerte(matriz)
+    n = matriz.n
+    if n == 1:
+        return np.ones((1, 1), dtype=np.float64)
+
+    acumulada = np.cumsum(pi)[:-1]
+    subida = acumulada / (pi[:-1] * matriz.superior)
+    bajada = (1.0 - acumulada) / (pi[1:] * matriz.inferior)
+    c_sub = np.concatenate(([0.0], np.cumsum(subida)))
+    c_baj = np.concatenate(([0.0], np.cumsum(bajada)))
+
+    M = np.where(np.arange(n)[:, None] < np.arange(n)[None, :],
+                 c_sub[None, :] - c_sub[:, None],
+                 c_baj[:, None] - c_baj[None, :])
+    M[np.diag_indices(n)] = 1.0 / pi
+    return M
+
+def huella_matriz(matriz):
+    """Hash del contenido de la matriz (densa, dispersa o tridiagonal)."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(matriz, MatrizTridiagonal):
+        partes = [matriz.inferior, matriz.diagonal, matriz.superior]
+    elif sp.issparse(matriz):
+        matriz = matriz.tocsr().sorted_indices()
+        partes = [matriz.data.astype(np.float64), matriz.indices, matriz.indptr]
+    else:
+        partes = [np.asarray(matriz, dtype=np.float64)]
+    h.update(repr(matriz.shape).encode())
+    for parte in partes:
+        h.update(np.ascontiguousarray(parte).tobytes())
+    return h.hexdigest()
+
+def _resolver_borde(Z, pi, S, f, total):
+    """
+    Resuelve el sistema con borde [[Z_SS, 1], [π_Sᵀ, 0]] [δ; c] = [f; total] y
+    retorna Z[:, S]δ + c. Da cualquier función armónica fuera de S en O(n·|S|).
+    """
+    k = len(S)
+    B = np.zeros((k + 1, k + 1), dtype=np.float64)
+    B[:k, :k] = Z[np.ix_(S, S)]
+    B[:k, k] = 1.0
+    B[k, :k] = pi[S]
+    rhs = np.append(np.asarray(f, dtype=np.float64), total)
+    sol = np.linalg.solve(B, rhs)
+    return Z[:, S] @ sol[:k] + sol[k]
+
+class MotorTiemposLlegada:
+    """
+    Tiempos de llegada con la matriz fundamental en una caché LRU acotada.
+    Cada cadena se factoriza una vez (O(n³)); las consultas cuestan O(1) u O(n·|A|).
+    Las consultas aceptan la matriz o la huella retornada por registrar().
+    """
+
+    def __init__(self, capacidad=8):
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+        self.capacidad = capacidad
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def registrar(self, matriz):
+        """Factoriza la cadena si no está en caché y retorna su huella."""
+        clave = huella_matriz(matriz)
+        if clave in self._cache:
+            self._cache.move_to_end(clave)
+            return clave
+
+        if isinstance(matriz, MatrizTridiagonal):
+            matriz = matriz.a_densa()
+        elif sp.issparse(matriz):
+            matriz = matriz.toarray()
+        self._cache[clave] = _matriz_fundamental(matriz)
+        if len(self._cache) > self.capacidad:
+            self._cache.popitem(last=False)
+        return clave
+
+    def _factores(self, matriz_o_clave):
+        if isinstance(matriz_o_clave, str):
+            if matriz_o_clave not in self._cache:
+                raise KeyError("Huella no registrada (pudo salir de la caché)")
+            self._cache.move_to_end(matriz_o_clave)
+            return self._cache[matriz_o_clave]
+        return self._cache[self.registrar(matriz_o_clave)]
+
+    def distribucion(self, matriz):
+        """Distribución estacionaria π de la cadena en caché."""
+        return self._factores(matriz)[1].copy()
+
+    def tiempo_medio(self, matriz, i, j):
+        """E_i[T_j]; si i == j es el tiempo medio de retorno 1/πⱼ."""
+        Z, pi = self._factores(matriz)
+        if i == j:
+            return 1.0 / pi[j]
+        return (Z[j, j] - Z[i, j]) / pi[j]
+
+    def tiempos_hacia(self, matriz, j):
+        """Vector E_i[T_j] para todo i (con el tiempo de retorno en la posición j)."""
+        Z, pi = self._factores(matriz)
+        t = (Z[j, j] - Z[:, j]) / pi[j]
+        t[j] = 1.0 / pi[j]
+        return t
+
+    def tiempos_llegada_conjunto(self, matriz, objetivo):
+        """E_i[T_A] con T_A = min{t ≥ 0 : X_t ∈ A} (cero sobre A)."""
+        Z, pi = self._factores(matriz)
+        A = np.unique(np.atleast_1d(objetivo))
+        t = _resolver_borde(Z, pi, A, np.zeros(len(A)), -1.0)
+        t[A] = 0.0
+        return t
+
+    def probabilidades_llegada(self, matriz, objetivo, evitar):
+        """P_i(T_A < T_B) para conjuntos disjuntos A (objetivo) y B (evitar)."""
+        Z, pi = self._factores(matriz)
+        A = np.unique(np.atleast_1d(objetivo))
+        B = np.unique(np.atleast_1d(evitar))
+        if np.intersect1d(A, B).size:
+            raise ValueError("Los conjuntos objetivo y evitar deben ser disjuntos")
+        S = np.concatenate((A, B))
+        f = np.concatenate((np.ones(len(A)), np.zeros(len(B))))
+        h = _resolver_borde(Z, pi, S, f, 0.0)
+        h[S] = f
+        return h
@@ -0,0 +1,90 @@
+"""
+Distribuciones transitorias πₜ = π₀Pᵗ sobre muchos horizontes.
+Combina productos vector-matriz dispersos para saltos cortos y potencias binarias
+P^(2^k) (calculadas una vez y reutilizadas) para saltos largos.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+from .nacimiento_muerte import MatrizTridiagonal
+
+MAX_DENSA = 4000
+
+class _PotenciasDiadicas:
+    """P^(2^k) densas, calculadas bajo demanda y guardadas."""
+
+    def __init__(self, P):
+        self._lista = [P.toarray() if sp.issparse(P) else np.asarray(P, dtype=np.float64)]
+
+    def __getitem__(self, k):
+        while len(self._lista) <= k:
+            self._lista.append(self._lista[-1] @ self._lista[-1])
+        return self._lista[k]
+
+    def aplicar(self, pi, paso):
+        """π·P^paso con un producto por cada bit de paso."""
+        k = 0
+        while paso:
+            if paso & 1:
+                pi = pi @ self[k]
+            paso >>= 1
+            k += 1
+        return pi
+
+def _preparar(matriz):
+    """Retorna (vecmat, P, n, nnz) para la representación de la matriz."""
+    if isinstance(matriz, MatrizTridiagonal):
+        return matriz.vecmat, matriz.a_dispersa(), matriz.n, 3 * matriz.n
+    if sp.issparse(matriz):
+        PT = matriz.T.tocsr()
+        return (lambda v: PT @ v), matriz, matriz.shape[0], matriz.nnz
+    P = np.asarray(matriz, dtype=np.float64)
+    return (lambda v: v @ P), P, P.shape[0], P.size
+
+def _usar_potencias(metodo, paso, n, nnz):
+    if metodo == "potencias":
+        return True
+    if metodo == "vecmat" or n > MAX_DENSA:
+        return False
+    return paso * nnz > n ** 3
+
+def horizontes_logaritmicos(t_max, por_decada=10):
+    """Horizontes enteros únicos en una rejilla logarítmica entre 1 y t_max."""
+    decadas = max(np.log10(t_max), 1e-12)
+    t = np.logspace(0, np.log10(t_max), int(np.ceil(decadas * por_decada)) + 1)
+    return np.unique(np.round(t).astype(np.int64))
+
+def iterar_transitorio(matriz, pi0, horizontes, metodo="auto"):
+    """
+    Generador perezoso de (t, πₜ) para los horizontes en orden creciente.
+    metodo: "vecmat" (solo productos dispersos), "potencias" (cuadrados binarios)
+    o "auto" (elige por salto según el costo estimado). Solo guarda un πₜ a la vez.
+    """
+    if metodo not in ("auto", "vecmat", "potencias"):
+        raise ValueError(f"Método desconocido: {metodo}")
+    vecmat, P, n, nnz = _preparar(matriz)
+    pi = np.asarray(pi0, dtype=np.float64).copy()
+    if pi.shape != (n,):
+        raise ValueError("pi0 debe tener longitud n")
+
+    potencias = None
+    t_actual = 0
+    for t in np.unique(np.asarray(horizontes, dtype=np.int64)):
+        if t < 0:
+            raise ValueError("Los horizontes deben ser no negativos")
+        paso = int(t - t_actual)
+        if _usar_potencias(metodo, paso, n, nnz):
+            if potencias is None:
+                potencias = _PotenciasDiadicas(P)
+            pi = potencias.aplicar(pi, paso)
+        else:
+            for _ in range(paso):
+                pi = vecmat(pi)
+        t_actual = int(t)
+        yield t_actual, pi
+
+def distribucion_transitoria(matriz, pi0, t, metodo="auto"):
+    """πₜ = π₀Pᵗ para un solo horizonte (O(log t) productos matriciales si conviene)."""
+    for _, pi in iterar_transitorio(matriz, pi0, [t], metodo):
+        return pi
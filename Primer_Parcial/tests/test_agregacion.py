@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.agregacion import calcular_distribucion_agregada, particion_agregable
+from src.dispersa import calcular_distribucion_dispersa
+
+AGREGABLE = np.array([
+    [.1, .2, .3, .4],
+    [.2, .1, .4, .3],
+    [.5, .0, .25, .25],
+    [.25, .25, .0, .5],
+])
+
+def _anillo(n, p):
+    P = np.zeros((n, n))
+    P[np.arange(n), (np.arange(n) + 1) % n] = p
+    P[np.arange(n), (np.arange(n) - 1) % n] = 1 - p
+    return P
+
+def test_ordinaria_sin_particion_inicial_es_un_error():
+    with pytest.raises(ValueError):
+        particion_agregable(AGREGABLE)
+    with pytest.raises(ValueError):
+        calcular_distribucion_agregada(AGREGABLE)
+
+def test_ordinaria_conserva_una_particion_agregable():
+    etiquetas = particion_agregable(AGREGABLE, [0, 0, 1, 1])
+    np.testing.assert_array_equal(etiquetas, [0, 0, 1, 1])
+
+    pi, info = calcular_distribucion_agregada(AGREGABLE, [0, 0, 1, 1])
+    referencia = calcular_distribucion_dispersa(AGREGABLE)
+    np.testing.assert_allclose(pi, referencia, atol=1e-10)
+    np.testing.assert_allclose(info["masa_bloques"],
+                               [referencia[:2].sum(), referencia[2:].sum()], atol=1e-12)
+    assert info["bloques"] == 2 and info["tipo"] == "ordinaria"
+    assert info["compresion"] is None
+
+def test_ordinaria_refina_una_particion_no_agregable():
+    P = _anillo(8, .3)
+    etiquetas = particion_agregable(P, np.arange(8) % 2)
+    assert etiquetas.max() + 1 == 2
+    etiquetas = particion_agregable(P, np.arange(8) < 3)
+    assert etiquetas.max() + 1 > 2
+    pi, _ = calcular_distribucion_agregada(P, np.arange(8) < 3)
+    np.testing.assert_allclose(pi, np.full(8, 1 / 8), atol=1e-10)
+
+def test_exacta_resuelve_solo_el_cociente():
+    P = _anillo(8, .3)
+    pi, info = calcular_distribucion_agregada(P, tipo="exacta")
+    np.testing.assert_allclose(pi, np.full(8, 1 / 8), atol=1e-12)
+    assert info["bloques"] == 1 and info["compresion"] == 8.0 and info["iteraciones"] == 0
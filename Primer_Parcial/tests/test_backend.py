@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from src.backend import GPU_AVAILABLE, a_host, limitar_hilos, obtener_backend
+from src.markov_matrix import (
+    calcular_distribucion_metodo_autovalores_gpu,
+    calcular_distribucion_metodo_tiempo_retorno_gpu,
+    calcular_distribucion_sistema_directo,
+    crear_matriz_probabilidad,
+)
+from src.nacimiento_muerte import calcular_distribucion_nacimiento_muerte, crear_matriz_probabilidad_banda
+
+def test_obtener_backend():
+    assert obtener_backend("numpy") is np
+    assert (obtener_backend("auto") is np) != GPU_AVAILABLE
+    with pytest.raises(ValueError):
+        obtener_backend("jax")
+    if not GPU_AVAILABLE:
+        with pytest.raises(RuntimeError):
+            obtener_backend("cupy")
+
+@pytest.mark.parametrize("hilos", [None, 1, 2])
+@pytest.mark.parametrize("n, p", [(5, 0.3), (120, 0.45), (300, 0.6)])
+def test_solvers_gpu_corren_en_cpu(n, p, hilos):
+    P = crear_matriz_probabilidad(n, p)
+    exacta = calcular_distribucion_nacimiento_muerte(crear_matriz_probabilidad_banda(n, p))
+    for solver in (calcular_distribucion_metodo_autovalores_gpu,
+                   calcular_distribucion_metodo_tiempo_retorno_gpu):
+        pi = solver(P, hilos=hilos)
+        assert isinstance(pi, np.ndarray)
+        np.testing.assert_allclose(pi, exacta, atol=1e-12)
+    np.testing.assert_allclose(calcular_distribucion_sistema_directo(P, "numpy", hilos), exacta,
+                               atol=1e-12)
+
+def test_limitar_hilos_y_a_host():
+    with limitar_hilos(1):
+        x = a_host(obtener_backend("auto").ones(3))
+    assert isinstance(x, np.ndarray) and x.sum() == 3
@@ -0,0 +1,11 @@
+from src import barrido, calibracion
+from src.markov_matrix import calcular_distribucion_sistema_directo
+
+def test_medidor_sin_gpu_etiqueta_numpy(monkeypatch):
+    monkeypatch.setattr(barrido, "GPU_AVAILABLE", False)
+    monkeypatch.setitem(calibracion.SOLUCIONADORES, "sistema_directo_gpu",
+                        (lambda P: calcular_distribucion_sistema_directo(P, "numpy"), "densa"))
+    for metodo in ("sistema", "sistema_directo", "sistema_directo_gpu"):
+        backend, medir = barrido._medidor(metodo)
+        assert backend == "numpy"
+        assert medir(10, [0.3, 0.6]).shape == (2,)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from src.calibracion import calcular_distribucion
+from src.clases import calcular_distribucion_por_clases
+from src.dispersa import calcular_distribucion_dispersa
+from src.lotes import calcular_distribuciones_autovalores_lote, calcular_distribuciones_lote
+from src.markov_matrix import (
+    calcular_distribucion_metodo_autovalores,
+    calcular_distribucion_metodo_autovalores_gpu,
+    calcular_distribucion_metodo_tiempo_retorno,
+    calcular_distribucion_metodo_tiempo_retorno_gpu,
+    calcular_distribucion_sistema_directo,
+)
+from src.nacimiento_muerte import MatrizTridiagonal, calcular_distribucion_nacimiento_muerte
+from src.precision_mixta import calcular_distribucion_precision_mixta
+
+REDUCIBLE = MatrizTridiagonal([.5, .5, .5, 0, .5], [1, 0, 0, 0, .5, .5], [0, .5, .5, .5, .5])
+
+def _dos_clases_densa():
+    P = np.zeros((5, 5))
+    P[0, :2] = [.5, .5]
+    P[1, :2] = [.3, .7]
+    P[2, [1, 2, 3]] = [.3, .4, .3]
+    P[3, 3:] = [.6, .4]
+    P[4, 3:] = [.2, .8]
+    return P
+
+def _dos_clases_con_transitorios():
+    """Clases cerradas {0, 1, 2} y {5, 6}; los estados 3 y 4 son transitorios."""
+    P = np.zeros((7, 7))
+    P[0, [1, 2]] = [.5, .5]
+    P[1, [0, 2]] = [.5, .5]
+    P[2, [0, 1]] = [.5, .5]
+    P[3, [2, 3, 4]] = [.3, .3, .4]
+    P[4, [3, 5]] = [.5, .5]
+    P[5, [5, 6]] = [.5, .5]
+    P[6, [5, 6]] = [.5, .5]
+    return P
+
+RESOLVEDORES_DENSOS = {
+    "autovalores": calcular_distribucion_metodo_autovalores,
+    "tiempo_retorno": calcular_distribucion_metodo_tiempo_retorno,
+    "sistema_directo": lambda P: calcular_distribucion_sistema_directo(P, "numpy"),
+    "autovalores_gpu": calcular_distribucion_metodo_autovalores_gpu,
+    "tiempo_retorno_gpu": calcular_distribucion_metodo_tiempo_retorno_gpu,
+    "calibracion_sistema_directo": lambda P: calcular_distribucion(P, metodo="sistema_directo"),
+    "calibracion_auto": lambda P: calcular_distribucion(P),
+    "lote": lambda P: calcular_distribuciones_lote(P[None])[0],
+    "autovalores_lote": lambda P: calcular_distribuciones_autovalores_lote(P[None])[0],
+    "dispersa": lambda P: calcular_distribucion_dispersa(sp.csr_matrix(P)),
+    "gmres": lambda P: calcular_distribucion_dispersa(sp.csr_matrix(P), "gmres"),
+    "precision_mixta": lambda P: calcular_distribucion_precision_mixta(P)[0],
+    "precision_mixta_dispersa": lambda P: calcular_distribucion_precision_mixta(sp.csr_matrix(P))[0],
+}
+
+@pytest.mark.parametrize("resolver", [
+    lambda T: calcular_distribucion_metodo_tiempo_retorno(T),
+    lambda T: calcular_distribucion_metodo_tiempo_retorno(T.a_densa()),
+    lambda T: calcular_distribucion_metodo_tiempo_retorno(T.a_dispersa(), reordenar=True),
+    lambda T: calcular_distribucion(T.a_densa()),
+    lambda T: calcular_distribucion_nacimiento_muerte(T),
+])
+def test_cadena_reducible_no_depende_de_la_representacion(resolver):
+    esperada = calcular_distribucion_por_clases(REDUCIBLE.a_densa())["pi"]
+    np.testing.assert_allclose(esperada, [5 / 12, 0, 0, 0, 7 / 24, 7 / 24], atol=1e-12)
+    np.testing.assert_allclose(resolver(REDUCIBLE), esperada, atol=1e-12)
+
+@pytest.mark.parametrize("nombre", RESOLVEDORES_DENSOS)
+@pytest.mark.parametrize("cadena", [_dos_clases_densa, _dos_clases_con_transitorios])
+def test_varias_clases_cerradas_en_todos_los_resolvedores(nombre, cadena):
+    P = cadena()
+    esperada = calcular_distribucion_por_clases(P)["pi"]
+    np.testing.assert_allclose(esperada.sum(), 1.0)
+    np.testing.assert_allclose(esperada @ P, esperada, atol=1e-12)
+    np.testing.assert_allclose(RESOLVEDORES_DENSOS[nombre](P), esperada, atol=1e-10)
+
+def test_lote_mezcla_matrices_reducibles_e_irreducibles():
+    irreducible = np.full((7, 7), 1 / 7)
+    pila = np.stack((irreducible, _dos_clases_con_transitorios(), irreducible))
+    pis = calcular_distribuciones_lote(pila)
+    np.testing.assert_allclose(pis[0], np.full(7, 1 / 7), atol=1e-12)
+    np.testing.assert_allclose(pis[1], calcular_distribucion_por_clases(pila[1])["pi"], atol=1e-12)
+    np.testing.assert_allclose(pis[2], pis[0], atol=1e-12)
@@ -0,0 +1,17 @@
+import numpy as np
+
+from src.continuacion import barrido_continuacion
+from src.markov_matrix import calcular_distribucion_sistema_directo, crear_matriz_probabilidad
+
+PS = np.arange(0.10, 0.40, 0.002)
+
+def _generar(p):
+    return crear_matriz_probabilidad(100, p)
+
+def test_continuacion_por_defecto_ahorra_un_orden_de_magnitud():
+    continuado = barrido_continuacion(_generar, PS)
+    en_frio = barrido_continuacion(_generar, PS, en_frio=True)
+    assert 10 * continuado["iteraciones"].sum() <= en_frio["iteraciones"].sum()
+    for p, pi in zip(PS[::15], continuado["distribuciones"][::15]):
+        np.testing.assert_allclose(pi, calcular_distribucion_sistema_directo(_generar(p), "numpy"),
+                                   atol=1e-10)
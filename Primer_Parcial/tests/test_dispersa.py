@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from src.dispersa import calcular_distribucion_dispersa
+from src.markov_matrix import (
+    calcular_distribucion_metodo_autovalores,
+    calcular_distribucion_metodo_tiempo_retorno,
+    calcular_distribucion_sistema_directo,
+    crear_matriz_probabilidad,
+)
+
+@pytest.mark.parametrize("metodo", ["directo", "gmres", "arnoldi"])
+@pytest.mark.parametrize("n", [1, 2, 3, 50])
+def test_metodos_dispersos_en_cadenas_pequenas(metodo, n):
+    P = crear_matriz_probabilidad(n, 0.4)
+    referencia = calcular_distribucion_dispersa(sp.csr_matrix(P), "directo")
+    np.testing.assert_allclose(calcular_distribucion_dispersa(sp.csr_matrix(P), metodo),
+                               referencia, atol=1e-8)
+    np.testing.assert_allclose(referencia @ P, referencia, atol=1e-12)
+
+def _banda_aleatoria(n, semilla=0):
+    """Cinco diagonales con pesos al azar: irreducible pero con π de rango muy amplio."""
+    datos = np.random.default_rng(semilla).random((5, n)) + 0.1
+    P = sp.diags([datos[i][:n - abs(i - 2)] for i in range(5)], [-2, -1, 0, 1, 2], format="csr")
+    return (sp.diags(1 / np.asarray(P.sum(axis=1)).ravel()) @ P).tocsr()
+
+@pytest.mark.parametrize("metodo", ["directo", "gmres", "arnoldi"])
+def test_cadena_irreducible_mal_condicionada(metodo):
+    P = _banda_aleatoria(3000)
+    pi = calcular_distribucion_dispersa(P, metodo)
+    assert np.sum(np.abs(P.T @ pi - pi)) < 1e-12
+    np.testing.assert_allclose(pi.sum(), 1.0)
+
+def _densa_con_ceros(n, semilla):
+    rng = np.random.default_rng(semilla)
+    P = rng.random((n, n)) * (rng.random((n, n)) < 0.2)
+    P[np.arange(n), (np.arange(n) + 1) % n] += 0.5
+    return P / P.sum(axis=1, keepdims=True)
+
+@pytest.mark.parametrize("P", [
+    crear_matriz_probabilidad(60, 0.3),
+    crear_matriz_probabilidad(60, 0.7),
+    _densa_con_ceros(80, 0),
+    _densa_con_ceros(150, 1),
+])
+def test_solves_dispersos_coinciden_con_los_densos(P):
+    referencia = calcular_distribucion_sistema_directo(P, "numpy")
+    np.testing.assert_allclose(calcular_distribucion_metodo_autovalores(P), referencia, atol=1e-12)
+    np.testing.assert_allclose(calcular_distribucion_metodo_tiempo_retorno(P), referencia, atol=1e-12)
+    D = sp.csr_matrix(P)
+    resultados = [calcular_distribucion_dispersa(D, metodo) for metodo in ("directo", "gmres", "arnoldi")]
+    resultados += [calcular_distribucion_metodo_autovalores(D),
+                   calcular_distribucion_metodo_tiempo_retorno(D, reordenar=True)]
+    for pi in resultados:
+        np.testing.assert_allclose(pi, referencia, atol=1e-10)
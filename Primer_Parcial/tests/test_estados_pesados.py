@@ -0,0 +1,33 @@
+import numpy as np
+import scipy.sparse as sp
+
+from src.estados_pesados import GRADO_CACHE, _paso_csr, estimar_estados_pesados
+
+def _estrella(n):
+    """El centro salta uniforme a las hojas; cada hoja vuelve al centro o avanza con 1/2: π₀ = 1/3."""
+    hojas = np.arange(1, n)
+    filas = np.concatenate((np.zeros(n - 1, dtype=np.int64), hojas, hojas))
+    columnas = np.concatenate((hojas, np.zeros(n - 1, dtype=np.int64), np.roll(hojas, -1)))
+    datos = np.concatenate((np.full(n - 1, 1.0 / (n - 1)), np.full(2 * (n - 1), 0.5)))
+    return sp.csr_matrix((datos, (filas, columnas)), shape=(n, n))
+
+def test_paso_csr_respeta_las_probabilidades_de_cada_fila():
+    n = 4 * GRADO_CACHE
+    rng = np.random.default_rng(0)
+    P = sp.random(n, n, density=0.002, random_state=1, format="csr") + _estrella(n)
+    P = (sp.diags(1 / np.asarray(P.sum(axis=1)).ravel()) @ P).tocsr()
+    acumulados = {}
+    for fila in (0, 1):
+        estados = np.full(200000, fila)
+        destinos = _paso_csr(P, estados, rng, acumulados)
+        frecuencia = np.bincount(destinos, minlength=n) / estados.size
+        np.testing.assert_allclose(frecuencia, P[fila].toarray().ravel(), atol=5e-3)
+    assert list(acumulados) == [0]
+
+def test_estado_mas_pesado_de_una_estrella():
+    r = estimar_estados_pesados(_estrella(5000), k=3, caminantes=2000,
+                                truncamiento=1000, semilla=0)
+    assert r["estados"][0] == 0
+    inferior, superior = r["intervalo"][0]
+    assert inferior < 1 / 3 < superior
+    assert np.all(np.isnan(r["pi"][1:]) | (r["pi"][1:] < 0.01))
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from src.fuera_de_memoria import (
+    MatrizEnDisco,
+    calcular_distribucion_fuera_de_memoria,
+    guardar_matriz_disco,
+)
+from src.markov_matrix import calcular_distribucion_sistema_directo
+
+def _aleatoria(n, semilla=0):
+    rng = np.random.default_rng(semilla)
+    P = rng.random((n, n)) * (rng.random((n, n)) < 0.05)
+    P[np.arange(n), (np.arange(n) + 1) % n] += 0.2
+    return P / P.sum(axis=1, keepdims=True)
+
+P = _aleatoria(300)
+
+@pytest.fixture
+def rutas(tmp_path):
+    densa = str(tmp_path / "P.npy")
+    np.save(densa, P)
+    return {"csr": guardar_matriz_disco(P, str(tmp_path / "csr"), dtype=np.float64),
+            "densa": densa}
+
+@pytest.mark.parametrize("formato, metodo", [("csr", "potencias"), ("csr", "gauss_seidel"),
+                                             ("densa", "potencias")])
+def test_fuera_de_memoria_por_bloques(rutas, formato, metodo):
+    disco = MatrizEnDisco(rutas[formato], memoria_bloque=4096)
+    assert len(list(disco.bloques())) > 1
+    progreso = []
+    pi, info = calcular_distribucion_fuera_de_memoria(
+        disco, metodo, tol=1e-13, max_iter=100000, progreso=lambda k, r, i: progreso.append(k))
+    assert info["convergio"] and info["bytes_leidos"] > 0 and info["mb_por_segundo"] > 0
+    assert progreso == list(range(1, info["iteraciones"] + 1))
+    np.testing.assert_allclose(pi, calcular_distribucion_sistema_directo(P, "numpy"), atol=1e-9)
+
+def test_gauss_seidel_requiere_csr(rutas):
+    with pytest.raises(ValueError):
+        calcular_distribucion_fuera_de_memoria(rutas["densa"], "gauss_seidel")
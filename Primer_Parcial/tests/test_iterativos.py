@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from src.iterativos import calcular_distribucion_iterativa
+from src.markov_matrix import calcular_distribucion_sistema_directo, crear_matriz_probabilidad
+
+P = crear_matriz_probabilidad(300, 0.45)
+
+@pytest.mark.parametrize("metodo", ["gauss_seidel", "sor", "anderson", "agregacion"])
+def test_iterativos_coinciden_con_el_solve_directo(metodo):
+    pi, info = calcular_distribucion_iterativa(P, metodo, max_iter=20000)
+    assert info["convergio"]
+    np.testing.assert_allclose(pi, calcular_distribucion_sistema_directo(P, "numpy"), atol=1e-9)
+
+def test_sor_estima_omega_y_acelera_gauss_seidel():
+    _, gauss_seidel = calcular_distribucion_iterativa(P, "gauss_seidel")
+    _, sor = calcular_distribucion_iterativa(P, "sor")
+    assert gauss_seidel["omega"] == 1.0
+    assert 1.0 < sor["omega"] < 2.0
+    assert 2 * sor["iteraciones"] < gauss_seidel["iteraciones"]
+    _, fijo = calcular_distribucion_iterativa(P, "sor", omega=1.5)
+    assert fijo["omega"] == 1.5
+
+def test_omega_invalido():
+    with pytest.raises(ValueError):
+        calcular_distribucion_iterativa(P, "sor", omega="optimo")
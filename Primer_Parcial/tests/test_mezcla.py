@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from src import mezcla
+from src.markov_matrix import crear_matriz_probabilidad
+from src.mezcla import curva_variacion_total, estimar_brecha_espectral
+
+P = crear_matriz_probabilidad(40, .4)
+
+def _tiempo_mezcla_paso_a_paso():
+    return curva_variacion_total(P, metodo="muestreo", inicios=np.arange(40),
+                                 t_max=1000)["tiempo_mezcla"]
+
+@pytest.mark.parametrize("metodo", ["potencias", "muestreo"])
+def test_tiempo_mezcla_en_el_borde_de_t_max(metodo):
+    t_mix = _tiempo_mezcla_paso_a_paso()
+    assert 128 < t_mix < 256
+    opciones = {"inicios": np.arange(40)} if metodo == "muestreo" else {}
+    for t_max in (t_mix, t_mix + 3, 255, 256, 1000):
+        r = curva_variacion_total(P, t_max=t_max, metodo=metodo, **opciones)
+        assert r["tiempo_mezcla"] == t_mix
+    assert curva_variacion_total(P, t_max=t_mix - 1, metodo=metodo, **opciones)["tiempo_mezcla"] is None
+
+def test_sin_refinar_la_cota_no_pasa_de_t_max():
+    t_mix = _tiempo_mezcla_paso_a_paso()
+    assert curva_variacion_total(P, t_max=t_mix + 3, refinar=False)["tiempo_mezcla"] == t_mix + 3
+    assert curva_variacion_total(P, t_max=1000, refinar=False)["tiempo_mezcla"] == 256
+
+def test_curva_es_no_creciente():
+    r = curva_variacion_total(P, t_max=194)
+    assert np.all(np.diff(r["d"]) <= 1e-12)
+    assert r["d"][r["t"] == r["tiempo_mezcla"]][0] < r["epsilon"]
+
+def _anillo(n, adelante=0.5, quieto=0.3):
+    """Anillo dirigido perezoso con saltos uniformes: no reversible, |λ₂| aislado."""
+    i = np.arange(n)
+    P = sp.csr_matrix((np.full(n, adelante), (i, (i + 1) % n)), shape=(n, n))
+    P = P + quieto * sp.identity(n) + (1 - adelante - quieto) / n * np.ones((n, n))
+    return sp.csr_matrix(P)
+
+def test_brecha_deflactada_coincide_con_el_espectro_denso(monkeypatch):
+    P = _anillo(30)
+    denso = estimar_brecha_espectral(P)
+    monkeypatch.setattr(mezcla, "MAX_DENSA", 10)
+    disperso = estimar_brecha_espectral(P)
+    assert disperso["convergio"]
+    np.testing.assert_allclose(disperso["lambda2"], denso["lambda2"], rtol=1e-6)
+    assert disperso["tiempo_mezcla"] == denso["tiempo_mezcla"]
+
+def test_brecha_de_cadenas_periodicas_y_reducibles():
+    i = np.arange(2000)
+    anillo = sp.csr_matrix((np.full(4000, 0.5),
+                            (np.r_[i, i], np.r_[(i + 1) % 2000, (i - 1) % 2000])))
+    dos_clases = sp.block_diag((_anillo(1000), _anillo(1000))).tocsr()
+    for P in (anillo, dos_clases):
+        r = estimar_brecha_espectral(P)
+        assert r["lambda2"] == 1.0 and r["convergio"]
+        assert r["tiempo_mezcla"] == np.inf
+
+def test_brecha_sin_convergencia_usa_la_cota_trivial():
+    r = estimar_brecha_espectral(_anillo(1001, adelante=0.9, quieto=0.05), max_iter=1, ncv=3)
+    assert not r["convergio"]
+    assert r["lambda2"] == 1.0 and r["tiempo_relajacion"] == np.inf
@@ -0,0 +1,40 @@
+import numpy as np
+import scipy.sparse as sp
+
+from src.markov_matrix import calcular_distribucion_sistema_directo, crear_matriz_probabilidad
+from src.simulacion import SimuladorCaminantes, TablaAlias, simular_distribucion
+
+def _aleatoria(n, semilla=0):
+    rng = np.random.default_rng(semilla)
+    P = rng.random((n, n)) * (rng.random((n, n)) < 0.3)
+    P[np.arange(n), (np.arange(n) + 1) % n] += 0.2
+    return P / P.sum(axis=1, keepdims=True)
+
+def test_tabla_alias_respeta_las_probabilidades():
+    P = _aleatoria(12)
+    tabla = TablaAlias(sp.csr_matrix(P))
+    rng = np.random.default_rng(1)
+    for fila in range(12):
+        destinos = tabla.muestrear(np.full(200000, fila), rng)
+        np.testing.assert_allclose(np.bincount(destinos, minlength=12) / destinos.size, P[fila],
+                                   atol=5e-3)
+
+def test_frecuencias_y_tiempos_de_retorno():
+    P = _aleatoria(8)
+    pi = calcular_distribucion_sistema_directo(P, "numpy")
+    np.testing.assert_allclose(simular_distribucion(P, 200, caminantes=20000, semilla=0), pi,
+                               atol=3e-3)
+
+    simulador = SimuladorCaminantes(P, caminantes=40000, semilla=0).avanzar(1000)
+    r = simulador.tiempos_retorno()
+    assert np.all(r["pendientes"] == 0)
+    assert np.all(np.abs(r["media"] - 1 / pi) < 4 * r["error"])
+
+def test_retornos_censurados_dan_nan_y_cota_inferior():
+    P = crear_matriz_probabilidad(30, 0.8)
+    simulador = SimuladorCaminantes(P, caminantes=3000, semilla=0).avanzar(5)
+    r = simulador.tiempos_retorno()
+    censurados = r["pendientes"] > 0
+    assert np.any(censurados)
+    assert np.all(np.isnan(r["media"][censurados]))
+    assert np.all(r["cota_inferior"][censurados] <= 5)
@@ -0,0 +1,62 @@
+"""
+Regresión del Método 2 (una factorización) contra los solves por estado de la
+versión original, sobre la rejilla (n, p) de los CSV de tiempos.
+"""
+
+import numpy as np
+import pytest
+
+from src.barrido import GRID_P
+from src.markov_matrix import crear_matriz_probabilidad, calcular_distribucion_metodo_tiempo_retorno
+from src.nacimiento_muerte import crear_matriz_probabilidad_banda, calcular_distribucion_nacimiento_muerte
+from src.tiempos_paso import calcular_matriz_primer_paso, calcular_tiempos_medios_retorno
+
+GRID_N = range(10, 200)
+PI_MIN = 1e-6
+
+def _primer_paso_por_estado(P):
+    """Versión original: un sistema (I - P₋ⱼ)h = 1 por cada estado objetivo j."""
+    n = P.shape[0]
+    M = np.zeros((n, n))
+    for j in range(n):
+        idx = [k for k in range(n) if k != j]
+        h = np.linalg.solve(np.eye(n - 1) - P[np.ix_(idx, idx)], np.ones(n - 1))
+        M[idx, j] = h
+        M[j, j] = 1.0 + P[j, idx] @ h
+    return M
+
+def _exacta(n, p):
+    return calcular_distribucion_nacimiento_muerte(crear_matriz_probabilidad_banda(n, p))
+
+def _celdas_bien_condicionadas():
+    """(n, p) donde min π ≥ PI_MIN, para que los solves por estado sean confiables."""
+    return [(n, p) for p in GRID_P for n in range(10, 200, 21) if _exacta(n, p).min() >= PI_MIN]
+
+@pytest.mark.parametrize("p", GRID_P)
+def test_distribucion_coincide_con_nacimiento_muerte(p):
+    for n in GRID_N:
+        pi = calcular_distribucion_metodo_tiempo_retorno(crear_matriz_probabilidad(n, p))
+        np.testing.assert_allclose(pi, _exacta(n, p), rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize("n,p", _celdas_bien_condicionadas())
+def test_tiempos_retorno_coinciden_con_solves_por_estado(n, p):
+    P = crear_matriz_probabilidad(n, p)
+    referencia = np.diag(_primer_paso_por_estado(P))
+    np.testing.assert_allclose(calcular_tiempos_medios_retorno(P), referencia, rtol=1e-8)
+    np.testing.assert_allclose(calcular_distribucion_metodo_tiempo_retorno(P),
+                               (1.0 / referencia) / np.sum(1.0 / referencia), rtol=1e-8)
+
+@pytest.mark.parametrize("n,p", _celdas_bien_condicionadas())
+def test_matriz_primer_paso_coincide_con_solves_por_estado(n, p):
+    P = crear_matriz_probabilidad(n, p)
+    np.testing.assert_allclose(calcular_matriz_primer_paso(P), _primer_paso_por_estado(P),
+                               rtol=1e-8)
+
+@pytest.mark.parametrize("p", GRID_P)
+def test_matriz_primer_paso_tridiagonal(p):
+    n = 40
+    banda = calcular_matriz_primer_paso(crear_matriz_probabilidad_banda(n, p))
+    if _exacta(n, p).min() >= PI_MIN:
+        densa = calcular_matriz_primer_paso(crear_matriz_probabilidad(n, p))
+        np.testing.assert_allclose(banda, densa, rtol=1e-8)
+    np.testing.assert_allclose(np.diag(banda), 1.0 / _exacta(n, p), rtol=1e-10)